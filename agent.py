@@ -15,6 +15,7 @@ from github_selector import GitHubSelector
 from application_manager import ApplicationManager
 from alerter import Alerter
 from telegram_bot import TelegramNotifier
+from notify_dispatcher import NotificationDispatcher
 
 logging.basicConfig(
     level=logging.INFO,
@@ -33,7 +34,18 @@ class JobAgent:
         self.app_manager = ApplicationManager(self.config)
         self.alerter = Alerter(self.config)
         self.telegram = TelegramNotifier(self.config)
+        # Popups and Telegram sends run on background workers so processing never waits on them
+        notify_config = self.config.get('notifications', {})
+        self.notifier = NotificationDispatcher(
+            max_queue=notify_config.get('queue_size', 100),
+            put_timeout=notify_config.get('put_timeout', 5),
+            flush_timeout=notify_config.get('flush_timeout', 60)
+        )
+        # A Telegram backlog of job alerts goes out as one digest instead of one message each
+        self.notifier.set_coalescer('telegram', self.telegram.coalesce_alerts, self.telegram.digest_threshold)
         self.latex_resume = LaTeXResumeGenerator(self.config)
+        # (job, refined score, Future of the resume path) for resumes still compiling
+        self._pending_resumes = []
         
         self.github_projects = self.github_selector.fetch_repositories()
         
@@ -84,49 +96,89 @@ class JobAgent:
         jobs = self.job_searcher.search_all_platforms()
         print(f"   Found {len(jobs)} relevant jobs")
         
-        new_jobs = [j for j in jobs if not self.app_manager.is_job_applied(
-            job_url=j.get('url', ''),
-            job_title=j.get('title', ''),
-            job_company=j.get('company', '')
-        )]
+        if self.config.get('search', {}).get('incremental', True):
+            # Postings seen in an earlier search were already considered then; only score the new ones
+            jobs = [j for j in jobs if j.get('is_new', True)]
+            print(f"   First seen this search: {len(jobs)}")
+        
+        new_jobs = self.app_manager.filter_new_jobs(jobs)
         print(f"   New jobs (not applied): {len(new_jobs)}")
         
         print("\n[2/3] Processing jobs...")
         
         notified_count = 0
-        for job in new_jobs[:self.config.get('search', {}).get('daily_limit', 10)]:
-            result = self._process_job(job)
-            if result == 'notified':
-                notified_count += 1
+        batch = new_jobs[:self.config.get('search', {}).get('daily_limit', 10)]
+        # Score the whole batch up front; each job then only does its own I/O
+        ats_results = self.job_analyzer.score_many(batch)
+        # One durable write for the run (with checkpoints) instead of one per job
+        with self.app_manager.batch():
+            for job, ats_result in zip(batch, ats_results):
+                result = self._process_job(job, ats_result)
+                if result == 'notified':
+                    notified_count += 1
+                self._finish_resumes()
+            self._finish_resumes(wait=True)
                 
         print("\n[3/3] Summary...")
         stats = self.app_manager.get_stats()
         print(f"   - Notified today: {notified_count}")
+        if self.job_analyzer.analysis_cache:
+            cache_stats = self.job_analyzer.analysis_cache.stats()
+            print(f"   - Analysis cache: {cache_stats['hits']} hits ({cache_stats['disk_hits']} from disk), "
+                  f"{cache_stats['misses']} misses")
+        compiles = self.latex_resume.compile_pool.stats()
+        if compiles['builds']:
+            print(f"   - Resume builds: {compiles['builds']} ({compiles['failed']} without PDF), "
+                  f"avg {compiles['avg_time']:.2f}s, max queue {compiles['max_queue_depth']}")
+        renders = self.latex_resume.render_stats()
+        if renders.get('renders'):
+            print(f"   - HTML resume renders: {renders['renders']} ({renders['failed']} failed), "
+                  f"avg {renders['avg_time']:.2f}s")
+        if self.latex_resume.build_cache:
+            build_stats = self.latex_resume.build_cache.stats()
+            print(f"   - Resume build cache: {build_stats['hits']} reused, {build_stats['misses']} built")
         print(f"   - Total notifications: {stats['total']}")
         
-        self.alerter.send_popup("Job Agent Complete", f"Sent alerts for {notified_count} jobs today")
+        self.notifier.submit('popup', self.alerter.send_popup, "Job Agent Complete",
+                             f"Sent alerts for {notified_count} jobs today")
         
-    def _process_job(self, job: dict) -> str:
-        print(f"\n   Processing: {job['title']} at {job['company']}")
+        # Deliver everything queued during the run before returning to the scheduler
+        self.notifier.flush()
+        for channel, m in self.notifier.metrics().items():
+            print(f"   - {channel}: {m['sent']} sent, {m['failed']} failed, {m['dropped']} dropped, "
+                  f"{m['coalesced']} merged into digests, avg {m['avg_latency']:.2f}s, max queue {m['max_depth']}")
+        for method, m in self.telegram.latency_report().items():
+            print(f"   - Telegram {method}: {m['calls']} calls, {m['failures']} failed, "
+                  f"{m['retries']} retries, avg {m['avg_latency']:.2f}s")
+        uploads = self.telegram.upload_report()
+        if uploads['uploads'] or uploads['reused']:
+            print(f"   - Telegram documents: {uploads['uploads']} uploaded ({uploads['bytes'] / 1024:.0f} KB, "
+                  f"avg {uploads['avg_latency']:.2f}s), {uploads['reused']} re-sent by file_id "
+                  f"({uploads['bytes_saved'] / 1024:.0f} KB saved)")
         
-        # Step 1: Detect job type
-        job_type = self.job_analyzer.detect_job_type(
-            job.get('description', ''),
-            job.get('title', '')
-        )
-        print(f"   Job Type: {job_type}")
+    def _process_job(self, job: dict, ats_result: dict = None) -> str:
+        print(f"\n   Processing: {job['title']} at {job['company']}")
         
-        # Step 2: Calculate FAANG ATS score
-        ats_result = self.job_analyzer.calculate_ats_score(
-            job.get('description', ''),
-            job_type
-        )
+        if ats_result is None:
+            # Step 1: Detect job type
+            job_type = self.job_analyzer.detect_job_type(
+                job.get('description', ''),
+                job.get('title', '')
+            )
+            
+            # Step 2: Calculate FAANG ATS score
+            ats_result = self.job_analyzer.calculate_ats_score(
+                job.get('description', ''),
+                job_type
+            )
+        print(f"   Job Type: {ats_result['job_type']}")
         ats_score = ats_result['total']
         print(f"   FAANG ATS Score: {ats_score:.0f}/100")
         
         # Send Telegram alert with Link and Networking Hook
         networking_hook = ats_result.get('networking_hook', '')
-        self.telegram.send_job_alert(job, ats_score / 100, networking_hook=networking_hook)
+        self.notifier.submit('telegram', self.telegram.send_job_alert, job, ats_score / 100,
+                             networking_hook=networking_hook)
         
         # Step 3: CUSTOM LOGIC - If ATS < 90, create a tailored resume
         tailored_resume_path = None
@@ -135,14 +187,34 @@ class JobAgent:
             
             # Using LaTeX generator for premium quality
             # It internally uses the master resume and job description to tailor
-            latex_content, refined_score, path = self.latex_resume.tailor_resume(
+            latex_content, refined_score, build = self.latex_resume.submit_tailored_resume(
                 job.get('description', ''),
                 job.get('title', ''),
                 job.get('company', '')
             )
+            # The PDF compiles in the background; _finish_resumes records the job once it is ready
+            self._pending_resumes.append((job, refined_score, build))
+            return 'notified'
+
+        # Mark as notified in application manager
+        self.app_manager.add_application(job, tailored_resume_path, status='notified')
+        
+        return 'notified'
+        
+    def _finish_resumes(self, wait: bool = False):
+        """Send and record the tailored resumes whose builds are done (all of them if ``wait``)."""
+        still_building = []
+        for job, refined_score, build in self._pending_resumes:
+            if not wait and not build.done():
+                still_building.append((job, refined_score, build))
+                continue
+            try:
+                path = build.result()
+            except Exception as e:
+                print(f"   [WARN] Tailoring failed for {job['title']}: {e}")
+                path = None
             
             if path:
-                tailored_resume_path = path
                 print(f"   [OK] Tailored Resume Created: {os.path.basename(path)}")
                 
                 # Send the tailored resume document to Telegram
@@ -150,14 +222,13 @@ class JobAgent:
                 caption += f"Job: {job['title']}\n"
                 caption += f"Improved ATS Score: {refined_score:.0%}"
                 
-                self.telegram.send_document(path, caption)
+                self.notifier.submit('telegram', self.telegram.send_document, path, caption)
             else:
                 print("   [WARN] Tailoring failed, using fallback.")
-
-        # Mark as notified in application manager
-        self.app_manager.add_application(job, tailored_resume_path, status='notified')
-        
-        return 'notified'
+            
+            # Mark as notified in application manager
+            self.app_manager.add_application(job, path, status='notified')
+        self._pending_resumes = still_building
         
     def interactive_mode(self):
         print("\n--- INTERACTIVE MODE ---\n")
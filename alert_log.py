@@ -0,0 +1,174 @@
+import os
+import glob
+import gzip
+import json
+import shutil
+from contextlib import contextmanager
+from datetime import datetime, date
+from typing import Any, Dict, Iterator, Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows: no advisory locks, rotation is not coordinated across processes
+    fcntl = None
+
+
+class AlertLog:
+    """Append-only JSONL log of alerts.
+
+    Each record is one line written with a single ``write`` on a handle
+    opened in append mode, so logging costs the same however long the agent
+    has run and concurrent processes do not overwrite each other. The live
+    file is rotated when it passes ``max_bytes`` or the day changes, under an
+    exclusive lock on ``<path>.lock``; other writers notice the replaced file
+    and reopen it. Rotated segments (``alerts.<timestamp>.jsonl``) can be
+    gzip-compressed once no writer can still be appending to them.
+    ``iter_alerts`` streams records from all segments in order.
+    """
+
+    def __init__(self, path: str = 'logs/alerts.jsonl', max_bytes: int = 5 * 1024 * 1024,
+                 rotate_daily: bool = True, compress: bool = True, legacy_path: Optional[str] = None):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.rotate_daily = rotate_daily
+        self.compress = compress
+        self._root, self._ext = os.path.splitext(path)
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        self._file = None
+        self._lock_file = None
+        if legacy_path:
+            self._import_legacy(legacy_path)
+
+    def _import_legacy(self, legacy_path: str):
+        """Move records from the old single-array JSON file into the JSONL log (once)."""
+        if not os.path.exists(legacy_path):
+            return
+        try:
+            with open(legacy_path, 'r') as f:
+                alerts = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"Could not import {legacy_path}: {e}")
+            return
+        for record in alerts:
+            self.write(record)
+        os.replace(legacy_path, legacy_path + '.migrated')
+
+    def _open(self):
+        self._file = open(self.path, 'ab', buffering=0)
+
+    def _reopen_if_replaced(self):
+        """Reopen the live file if another process rotated it away (as WatchedFileHandler does)."""
+        if self._file is not None:
+            try:
+                replaced = os.stat(self.path).st_ino != os.fstat(self._file.fileno()).st_ino
+            except FileNotFoundError:
+                replaced = True
+            if not replaced:
+                return
+            self._file.close()
+        self._open()
+
+    @contextmanager
+    def _locked(self, exclusive: bool):
+        """Writers share ``<path>.lock``; rotation holds it exclusively (no-op without fcntl)."""
+        if fcntl is None:
+            yield
+            return
+        if self._lock_file is None:
+            self._lock_file = open(self.path + '.lock', 'a')
+        fcntl.flock(self._lock_file.fileno(), fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+        try:
+            yield
+        finally:
+            fcntl.flock(self._lock_file.fileno(), fcntl.LOCK_UN)
+
+    def _needs_rotation(self, incoming: int) -> bool:
+        # Size and age come from the file itself, since other processes append to it too
+        st = os.fstat(self._file.fileno())
+        if not st.st_size:
+            return False
+        if self.max_bytes and st.st_size + incoming > self.max_bytes:
+            return True
+        return self.rotate_daily and datetime.fromtimestamp(st.st_mtime).date() != date.today()
+
+    def rotate(self):
+        """Move the live file aside as a segment; call with the lock held exclusively."""
+        if self._file:
+            self._file.close()
+            self._file = None
+        if not os.path.exists(self.path) or not os.path.getsize(self.path):
+            return
+        # Timestamped names sort chronologically, which is the order iter_alerts reads them in
+        stamp = datetime.now().strftime('%Y%m%d-%H%M%S-%f')
+        segment = f"{self._root}.{stamp}{self._ext}"
+        n = 1
+        while os.path.exists(segment) or os.path.exists(segment + '.gz'):
+            segment = f"{self._root}.{stamp}-{n:03d}{self._ext}"
+            n += 1
+        os.replace(self.path, segment)
+        if self.compress:
+            self._compress_segments(keep=segment)
+
+    def _compress_segments(self, keep: str):
+        """Gzip rotated segments, except ``keep``: a writer that has not noticed the
+        rotation yet may still append to the newest one. It is compressed next time."""
+        for segment in glob.glob(f"{glob.escape(self._root)}.*{self._ext}"):
+            if segment == keep:
+                continue
+            with open(segment, 'rb') as src, gzip.open(segment + '.gz', 'wb') as dst:
+                shutil.copyfileobj(src, dst)
+            os.remove(segment)
+
+    def write(self, record: Dict[str, Any]):
+        line = (json.dumps(record, default=str, ensure_ascii=False) + '\n').encode('utf-8')
+        with self._locked(exclusive=False):
+            self._reopen_if_replaced()
+            if not self._needs_rotation(len(line)):
+                self._file.write(line)
+                return
+        with self._locked(exclusive=True):
+            # Another process may have rotated while we waited for the lock
+            self._reopen_if_replaced()
+            if self._needs_rotation(len(line)):
+                self.rotate()
+                self._open()
+            self._file.write(line)
+
+    def segments(self):
+        """Rotated segments, oldest first, followed by the live file."""
+        rotated = sorted(
+            glob.glob(f"{glob.escape(self._root)}.*{self._ext}") +
+            glob.glob(f"{glob.escape(self._root)}.*{self._ext}.gz"),
+            key=lambda name: name[:-3] if name.endswith('.gz') else name
+        )
+        if os.path.exists(self.path):
+            rotated.append(self.path)
+        return rotated
+
+    def iter_alerts(self, since: Optional[str] = None, alert_type: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+        """Stream logged alerts, optionally only those at/after ``since`` (ISO time) or of one type."""
+        for segment in self.segments():
+            opener = gzip.open if segment.endswith('.gz') else open
+            try:
+                with opener(segment, 'rt', encoding='utf-8') as f:
+                    for line in f:
+                        try:
+                            record = json.loads(line)
+                        except ValueError:
+                            # A torn last line from a crash; skip it
+                            continue
+                        if since and record.get('timestamp', '') < since:
+                            continue
+                        if alert_type and record.get('type') != alert_type:
+                            continue
+                        yield record
+            except OSError:
+                continue
+
+    def close(self):
+        if self._file:
+            self._file.close()
+            self._file = None
+        if self._lock_file:
+            self._lock_file.close()
+            self._lock_file = None
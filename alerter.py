@@ -1,9 +1,10 @@
 import os
-import json
 import logging
 from datetime import datetime
 from plyer import notification
 
+from alert_log import AlertLog
+
 logger = logging.getLogger(__name__)
 
 
@@ -12,11 +13,20 @@ class Alerter:
         self.config = config
         self.alert_method = config.get('notifications', {}).get('alert_method', 'popup')
         self.popup_title = config.get('notifications', {}).get('popup_title', 'Job Agent')
-        self.alerts_log_path = 'logs/alerts.json'
+        log_config = config.get('alert_log', {})
+        self.alerts_log_path = log_config.get('path', 'logs/alerts.jsonl')
         self._ensure_log_dir()
+        # Append-only JSONL; the old logs/alerts.json array is folded in on first use
+        self.alert_log = AlertLog(
+            self.alerts_log_path,
+            max_bytes=int(log_config.get('max_mb', 5) * 1024 * 1024),
+            rotate_daily=log_config.get('rotate_daily', True),
+            compress=log_config.get('compress', True),
+            legacy_path='logs/alerts.json'
+        )
         
     def _ensure_log_dir(self):
-        os.makedirs('logs', exist_ok=True)
+        os.makedirs(os.path.dirname(self.alerts_log_path) or 'logs', exist_ok=True)
         
     def _log_alert(self, alert_type, message, details=None):
         alert_record = {
@@ -25,17 +35,11 @@ class Alerter:
             'message': message,
             'details': details or {}
         }
+        self.alert_log.write(alert_record)
         
-        if os.path.exists(self.alerts_log_path):
-            with open(self.alerts_log_path, 'r') as f:
-                alerts = json.load(f)
-        else:
-            alerts = []
-            
-        alerts.append(alert_record)
-        
-        with open(self.alerts_log_path, 'w') as f:
-            json.dump(alerts, f, indent=2)
+    def iter_alerts(self, since=None, alert_type=None):
+        """Stream past alerts (oldest first) without loading the whole log."""
+        return self.alert_log.iter_alerts(since, alert_type)
             
     def send_popup(self, title, message):
         try:
@@ -0,0 +1,125 @@
+import os
+import json
+import time
+import sqlite3
+import hashlib
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    name TEXT PRIMARY KEY,
+    value TEXT
+);
+CREATE TABLE IF NOT EXISTS analyses (
+    key TEXT PRIMARY KEY,
+    result TEXT NOT NULL,
+    last_used REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_analyses_last_used ON analyses(last_used);
+"""
+
+
+def fingerprint(value: Any) -> str:
+    """Stable hash of any JSON-like value."""
+    data = json.dumps(value, sort_keys=True, default=str, ensure_ascii=False)
+    return hashlib.sha256(data.encode('utf-8')).hexdigest()
+
+
+class AnalysisCache:
+    """Remembers job analysis results by content hash across runs.
+
+    Keys hash the description, title, profile version (parsed resume +
+    GitHub projects) and analyzer version, so identical postings seen again
+    on a later cycle are not rescored. A bounded LRU in memory sits in front
+    of a SQLite table. When the profile version changes, the stored results
+    are dropped since none of them can be hit again.
+    """
+
+    def __init__(self, db_path: str = 'data/analysis_cache.db', memory_entries: int = 512,
+                 max_entries: int = 20000):
+        self.db_path = db_path
+        self.memory_entries = memory_entries
+        self.max_entries = max_entries
+        os.makedirs(os.path.dirname(db_path) or '.', exist_ok=True)
+        self.conn = sqlite3.connect(db_path)
+        self.conn.executescript(SCHEMA)
+        self._memory: 'OrderedDict[str, Dict]' = OrderedDict()
+        self._profile = None
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+    def set_profile(self, version: str):
+        """Switch to a profile version, clearing results computed for another one."""
+        if version == self._profile:
+            return
+        self._profile = version
+        row = self.conn.execute("SELECT value FROM meta WHERE name = 'profile'").fetchone()
+        if row and row[0] == version:
+            return
+        self._memory.clear()
+        with self.conn:
+            self.conn.execute("DELETE FROM analyses")
+            self.conn.execute("INSERT OR REPLACE INTO meta (name, value) VALUES ('profile', ?)", (version,))
+
+    def key(self, description: str, title: str, analyzer_version: str) -> str:
+        return fingerprint([description, title, self._profile, analyzer_version])
+
+    def get(self, key: str) -> Optional[Dict]:
+        result = self._memory.get(key)
+        if result is not None:
+            self._memory.move_to_end(key)
+            self.hits += 1
+            return result
+
+        row = self.conn.execute("SELECT result FROM analyses WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            self.misses += 1
+            return None
+        result = json.loads(row[0])
+        self._remember(key, result)
+        self.hits += 1
+        self.disk_hits += 1
+        return result
+
+    def put_many(self, results: Dict[str, Dict]):
+        if not results:
+            return
+        now = time.time()
+        for key, result in results.items():
+            self._remember(key, result)
+        with self.conn:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO analyses (key, result, last_used) VALUES (?, ?, ?)",
+                [(key, json.dumps(result, default=str), now) for key, result in results.items()]
+            )
+        self._evict()
+
+    def touch_many(self, keys):
+        """Mark disk entries as recently used so eviction keeps live postings."""
+        now = time.time()
+        with self.conn:
+            self.conn.executemany("UPDATE analyses SET last_used = ? WHERE key = ?", [(now, k) for k in keys])
+
+    def _remember(self, key: str, result: Dict):
+        self._memory[key] = result
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_entries:
+            self._memory.popitem(last=False)
+
+    def _evict(self):
+        count = self.conn.execute("SELECT COUNT(*) FROM analyses").fetchone()[0]
+        if count <= self.max_entries:
+            return
+        with self.conn:
+            self.conn.execute(
+                "DELETE FROM analyses WHERE key IN (SELECT key FROM analyses ORDER BY last_used LIMIT ?)",
+                (count - self.max_entries,)
+            )
+
+    def stats(self) -> Dict[str, int]:
+        return {'hits': self.hits, 'disk_hits': self.disk_hits, 'misses': self.misses}
+
+    def close(self):
+        self.conn.close()
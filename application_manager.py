@@ -1,31 +1,38 @@
-import json
-import os
 from datetime import datetime
 from typing import List, Dict, Any
 
+from application_store import JsonApplicationStore, SqliteApplicationStore, StoredStats
+
 class ApplicationManager:
     def __init__(self, config):
-        self.storage_path = config.get('storage', {}).get('path', 'data/applications.json')
-        self._ensure_storage_dir()
-        self.applications = self._load_applications()
-        
-    def _ensure_storage_dir(self):
-        os.makedirs(os.path.dirname(self.storage_path), exist_ok=True)
-        
-    def _load_applications(self):
-        if os.path.exists(self.storage_path):
-            with open(self.storage_path, 'r') as f:
-                return json.load(f)
-        return {'applications': [], 'stats': {'total': 0, 'applied': 0, 'pending': 0, 'rejected': 0}}
+        storage = config.get('storage', {})
+        self.storage_path = storage.get('path', 'data/applications.json')
+        # 'json' rewrites one file per change; 'sqlite' keeps indexed rows and imports the JSON once
+        self.storage_type = storage.get('type', 'json')
+        # Changes inside batch() are flushed every N changes (0 = only when the batch ends)
+        checkpoint_every = storage.get('checkpoint_every', 10)
+        if self.storage_type == 'sqlite':
+            self.store = SqliteApplicationStore(storage.get('db_path', 'data/applications.db'), self.storage_path,
+                                                checkpoint_every=checkpoint_every)
+        else:
+            self.store = JsonApplicationStore(self.storage_path, checkpoint_every=checkpoint_every)
+
+    @staticmethod
+    def stats_reader(config) -> StoredStats:
+        """Constant-time access to the persisted counters, without loading the history."""
+        storage = config.get('storage', {})
+        db_path = storage.get('db_path', 'data/applications.db') if storage.get('type', 'json') == 'sqlite' else None
+        return StoredStats(storage.get('path', 'data/applications.json'), db_path)
         
-    def _save_applications(self):
-        with open(self.storage_path, 'w') as f:
-            json.dump(self.applications, f, indent=2)
-            
-    def add_application(self, job_data: Dict[str, Any], tailored_resume_path: str = None, 
+    def batch(self):
+        """Unit of work for a run: ``with app_manager.batch(): ...`` writes once at the end
+        (plus periodic checkpoints) instead of once per added or updated application."""
+        return self.store.batch()
+
+    def add_application(self, job_data: Dict[str, Any], tailored_resume_path: str = None,
                        selected_projects: List[str] = None, status: str = 'pending'):
-        app_id = f"app_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-        
+        app_id = f"app_{datetime.now().strftime('%Y%m%d_%H%M%S_%f')}"
+
         application = {
             'id': app_id,
             'job': job_data,
@@ -35,47 +42,34 @@ class ApplicationManager:
             'status': status,
             'created_at': datetime.now().isoformat()
         }
-        
-        self.applications['applications'].append(application)
-        self._update_stats()
-        self._save_applications()
-        
+
+        self.store.add(application)
+
         return app_id
-        
+
     def update_status(self, app_id: str, status: str):
-        for app in self.applications['applications']:
-            if app['id'] == app_id:
-                app['status'] = status
-                if status == 'applied' and not app.get('applied_date'):
-                    app['applied_date'] = datetime.now().isoformat()
-                break
-        self._update_stats()
-        self._save_applications()
-        
-    def _update_stats(self):
-        apps = self.applications['applications']
-        self.applications['stats'] = {
-            'total': len(apps),
-            'applied': len([a for a in apps if a['status'] == 'applied']),
-            'pending': len([a for a in apps if a['status'] == 'pending']),
-            'rejected': len([a for a in apps if a['status'] == 'rejected'])
-        }
-        
+        self.store.update_status(app_id, status)
+
     def get_pending_applications(self):
-        return [a for a in self.applications['applications'] if a['status'] == 'pending']
-        
+        return self.store.with_status('pending')
+
     def is_job_applied(self, job_url: str = None, job_title: str = None, job_company: str = None) -> bool:
-        for app in self.applications['applications']:
-            if job_url and app['job'].get('url') == job_url:
-                return True
-            if job_title and job_company:
-                if app['job'].get('title', '').lower() == job_title.lower() and \
-                   app['job'].get('company', '').lower() == job_company.lower():
-                    return True
-        return False
-        
+        return self.store.contains(job_url, job_title, job_company)
+
+    def filter_new_jobs(self, jobs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Jobs from ``jobs`` that are not in the application history yet."""
+        return [j for j in jobs if not self.is_job_applied(
+            job_url=j.get('url', ''),
+            job_title=j.get('title', ''),
+            job_company=j.get('company', '')
+        )]
+
     def get_stats(self):
-        return self.applications['stats']
-        
+        return self.store.stats()
+
+    def rebuild_stats(self) -> bool:
+        """Recount the status counters from the history; False if they were out of sync."""
+        return self.store.check_stats()
+
     def get_all_applications(self):
-        return self.applications['applications']
+        return self.store.all()
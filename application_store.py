@@ -0,0 +1,453 @@
+import os
+import json
+import sqlite3
+from contextlib import contextmanager
+from datetime import datetime
+from typing import List, Dict, Any, Optional
+
+STATUSES = ('applied', 'pending', 'rejected')
+# Stored with the JSON history once its counters cover every status
+STATS_VERSION = 2
+
+
+def normalize(value: Optional[str]) -> str:
+    return (value or '').lower()
+
+
+def count_statuses(statuses) -> Dict[str, int]:
+    """Full recount: total plus one counter per status seen (the classic three always present)."""
+    stats = {'total': 0, **{status: 0 for status in STATUSES}}
+    for status in statuses:
+        stats['total'] += 1
+        stats[status] = stats.get(status, 0) + 1
+    return stats
+
+
+def move_status(stats: Dict[str, int], old: Optional[str], new: Optional[str]):
+    """Apply one status transition to the counters (``None`` = not present)."""
+    if old is not None:
+        stats[old] -= 1
+        if not stats[old] and old not in STATUSES:
+            del stats[old]
+    else:
+        stats['total'] += 1
+    if new is not None:
+        stats[new] = stats.get(new, 0) + 1
+
+
+class JsonApplicationStore:
+    """The original storage: the whole history in memory, rewritten to one JSON file on change."""
+
+    def __init__(self, path: str = 'data/applications.json', checkpoint_every: int = 0):
+        self.path = path
+        self.checkpoint_every = checkpoint_every
+        self._batch_depth = 0
+        self._unsaved = 0
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        self.applications = self._load()
+        # Lookup indexes over the history, kept in sync by add
+        self._by_id = {}
+        self._urls = set()
+        self._title_company = set()
+        for app in self.applications['applications']:
+            self._index_application(app)
+        # Files written before the counters were kept incrementally only counted
+        # applied/pending/rejected: recount those once. Later drift is fixed on demand (check_stats).
+        if self.applications.get('stats_version') != STATS_VERSION:
+            self.check_stats()
+            self.applications['stats_version'] = STATS_VERSION
+
+    def _load(self) -> Dict[str, Any]:
+        if os.path.exists(self.path):
+            with open(self.path, 'r') as f:
+                return json.load(f)
+        return {'applications': [], 'stats': {'total': 0, 'applied': 0, 'pending': 0, 'rejected': 0},
+                'stats_version': STATS_VERSION}
+
+    def _save(self):
+        if self._batch_depth:
+            # Inside batch(): remember the change and only write at checkpoints / the end
+            self._unsaved += 1
+            if self.checkpoint_every and self._unsaved >= self.checkpoint_every:
+                self._write()
+            return
+        self._write()
+
+    def _write(self):
+        # Write a temp file and rename it over the store, so a crash leaves the old or the new file
+        tmp_path = self.path + '.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump(self.applications, f, indent=2)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.path)
+        self._unsaved = 0
+
+    @contextmanager
+    def batch(self):
+        """Defer writes until the block ends (or a checkpoint is reached)."""
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth and self._unsaved:
+                self._write()
+
+    def _index_application(self, app: Dict[str, Any]):
+        # Ids are only unique per second in old histories, so the first application keeps the id
+        self._by_id.setdefault(app['id'], app)
+        job = app['job']
+        if job.get('url'):
+            self._urls.add(job['url'])
+        self._title_company.add((normalize(job.get('title')), normalize(job.get('company'))))
+
+    def check_stats(self) -> bool:
+        """Recount statuses; fix the stored counters and return False if they had drifted."""
+        actual = count_statuses(a['status'] for a in self.applications['applications'])
+        if self.applications.get('stats') == actual:
+            return True
+        self.applications['stats'] = actual
+        return False
+
+    def add(self, application: Dict[str, Any]):
+        self.applications['applications'].append(application)
+        self._index_application(application)
+        move_status(self.applications['stats'], None, application['status'])
+        self._save()
+
+    def update_status(self, app_id: str, status: str):
+        app = self._by_id.get(app_id)
+        if not app:
+            return
+        move_status(self.applications['stats'], app['status'], status)
+        app['status'] = status
+        if status == 'applied' and not app.get('applied_date'):
+            app['applied_date'] = datetime.now().isoformat()
+        self._save()
+
+    def contains(self, job_url: str = None, job_title: str = None, job_company: str = None) -> bool:
+        if job_url and job_url in self._urls:
+            return True
+        if job_title and job_company:
+            return (job_title.lower(), job_company.lower()) in self._title_company
+        return False
+
+    def with_status(self, status: str) -> List[Dict[str, Any]]:
+        return [a for a in self.applications['applications'] if a['status'] == status]
+
+    def stats(self) -> Dict[str, int]:
+        return dict(self.applications['stats'])
+
+    def all(self) -> List[Dict[str, Any]]:
+        return self.applications['applications']
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    url TEXT,
+    title TEXT,
+    company TEXT,
+    title_norm TEXT NOT NULL,
+    company_norm TEXT NOT NULL,
+    platform TEXT,
+    data TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS applications (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    app_id TEXT NOT NULL,
+    job_id INTEGER NOT NULL REFERENCES jobs(id),
+    tailored_resume_path TEXT,
+    applied_date TEXT,
+    status TEXT NOT NULL,
+    created_at TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS status_counts (
+    status TEXT PRIMARY KEY,
+    count INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS application_projects (
+    application_id INTEGER NOT NULL REFERENCES applications(id),
+    position INTEGER NOT NULL,
+    project TEXT NOT NULL,
+    PRIMARY KEY (application_id, position)
+);
+CREATE INDEX IF NOT EXISTS idx_jobs_url ON jobs(url);
+CREATE INDEX IF NOT EXISTS idx_jobs_title_company ON jobs(title_norm, company_norm);
+CREATE INDEX IF NOT EXISTS idx_applications_app_id ON applications(app_id);
+CREATE INDEX IF NOT EXISTS idx_applications_job ON applications(job_id);
+CREATE INDEX IF NOT EXISTS idx_applications_status ON applications(status);
+CREATE INDEX IF NOT EXISTS idx_applications_created_at ON applications(created_at);
+"""
+
+
+class SqliteApplicationStore:
+    """Application history in SQLite (WAL mode).
+
+    Every change is one small transaction touching only the rows involved,
+    so a run costs I/O proportional to the jobs it handles rather than to
+    the whole history, and an interrupted write cannot corrupt what is
+    already stored. The JSON history at ``legacy_path`` is imported the
+    first time the database is created.
+    """
+
+    def __init__(self, db_path: str = 'data/applications.db', legacy_path: str = 'data/applications.json',
+                 checkpoint_every: int = 0):
+        self.db_path = db_path
+        self.checkpoint_every = checkpoint_every
+        self._batch_depth = 0
+        self._unsaved = 0
+        os.makedirs(os.path.dirname(db_path) or '.', exist_ok=True)
+        self.conn = sqlite3.connect(db_path)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("PRAGMA foreign_keys=ON")
+        self.conn.executescript(SCHEMA)
+        self._import_legacy(legacy_path)
+        # Status counters live in status_counts and are mirrored here for get_stats;
+        # they are only recounted on request (check_stats), never on startup
+        self._stats = self._stored_stats()
+
+    def _import_legacy(self, legacy_path: str):
+        if not legacy_path or not os.path.exists(legacy_path):
+            return
+        if self.conn.execute("SELECT 1 FROM applications LIMIT 1").fetchone():
+            return
+        try:
+            with open(legacy_path, 'r') as f:
+                apps = json.load(f).get('applications', [])
+        except (OSError, ValueError) as e:
+            print(f"Could not import {legacy_path}: {e}")
+            return
+        with self.conn:
+            for app in apps:
+                self._insert(app)
+            self._write_stats(count_statuses(app['status'] for app in apps))
+        print(f"Imported {len(apps)} applications from {legacy_path} into {self.db_path}")
+
+    def _insert(self, application: Dict[str, Any]):
+        job = application.get('job') or {}
+        cur = self.conn.execute(
+            "INSERT INTO jobs (url, title, company, title_norm, company_norm, platform, data) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (job.get('url'), job.get('title'), job.get('company'), normalize(job.get('title')),
+             normalize(job.get('company')), job.get('platform'), json.dumps(job, default=str))
+        )
+        cur = self.conn.execute(
+            "INSERT INTO applications (app_id, job_id, tailored_resume_path, applied_date, status, created_at) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            (application['id'], cur.lastrowid, application.get('tailored_resume_path'),
+             application.get('applied_date'), application['status'],
+             application.get('created_at') or datetime.now().isoformat())
+        )
+        self.conn.executemany(
+            "INSERT INTO application_projects (application_id, position, project) VALUES (?, ?, ?)",
+            [(cur.lastrowid, i, project) for i, project in enumerate(application.get('selected_projects') or [])]
+        )
+        return cur.lastrowid
+
+    def _stored_stats(self) -> Dict[str, int]:
+        stats = {'total': 0, **{status: 0 for status in STATUSES}}
+        for row in self.conn.execute("SELECT status, count FROM status_counts WHERE count != 0"):
+            stats[row['status']] = row['count']
+        return stats
+
+    def _write_stats(self, stats: Dict[str, int]):
+        self.conn.execute("DELETE FROM status_counts")
+        self.conn.executemany(
+            "INSERT INTO status_counts (status, count) VALUES (?, ?)", list(stats.items())
+        )
+
+    def _bump(self, key: str, delta: int):
+        self.conn.execute(
+            "INSERT INTO status_counts (status, count) VALUES (?, ?) "
+            "ON CONFLICT(status) DO UPDATE SET count = count + excluded.count",
+            (key, delta)
+        )
+
+    @contextmanager
+    def _transaction(self):
+        if not self._batch_depth:
+            with self.conn:
+                yield
+            return
+        # Inside batch(): keep the transaction open until a checkpoint or the end of the batch,
+        # with a savepoint so a change that fails halfway is undone on its own
+        if not self.conn.in_transaction:
+            # Opened explicitly, so releasing the savepoint does not commit
+            self.conn.execute("BEGIN")
+        self.conn.execute("SAVEPOINT change")
+        try:
+            yield
+        except BaseException:
+            self.conn.execute("ROLLBACK TO change")
+            self.conn.execute("RELEASE change")
+            raise
+        self.conn.execute("RELEASE change")
+        self._unsaved += 1
+        if self.checkpoint_every and self._unsaved >= self.checkpoint_every:
+            self._commit()
+
+    def _commit(self):
+        self.conn.commit()
+        self._unsaved = 0
+
+    @contextmanager
+    def batch(self):
+        """Group changes into one transaction, committed at checkpoints and when the block ends.
+
+        If the block raises, changes since the last checkpoint are rolled back.
+        """
+        self._batch_depth += 1
+        clean = False
+        try:
+            yield self
+            clean = True
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth:
+                if clean:
+                    self._commit()
+                else:
+                    self.conn.rollback()
+                    self._unsaved = 0
+                    # The in-memory counters included the rolled-back changes
+                    self._stats = self._stored_stats()
+
+    def check_stats(self) -> bool:
+        """Recount statuses; fix the stored counters and return False if they had drifted."""
+        actual = {'total': 0, **{status: 0 for status in STATUSES}}
+        # Answered from idx_applications_status without reading the rows
+        for status, count in self.conn.execute("SELECT status, COUNT(*) FROM applications GROUP BY status"):
+            actual[status] = count
+            actual['total'] += count
+        if self._stats == actual:
+            return True
+        with self._transaction():
+            self._write_stats(actual)
+        self._stats = actual
+        return False
+
+    def add(self, application: Dict[str, Any]):
+        with self._transaction():
+            self._insert(application)
+            self._bump('total', 1)
+            self._bump(application['status'], 1)
+        move_status(self._stats, None, application['status'])
+
+    def update_status(self, app_id: str, status: str):
+        row = self.conn.execute(
+            "SELECT id, status, applied_date FROM applications WHERE app_id = ? ORDER BY id LIMIT 1", (app_id,)
+        ).fetchone()
+        if not row:
+            return
+        applied_date = row['applied_date']
+        if status == 'applied' and not applied_date:
+            applied_date = datetime.now().isoformat()
+        with self._transaction():
+            self.conn.execute(
+                "UPDATE applications SET status = ?, applied_date = ? WHERE id = ?",
+                (status, applied_date, row['id'])
+            )
+            self._bump(row['status'], -1)
+            self._bump(status, 1)
+        move_status(self._stats, row['status'], status)
+
+    def contains(self, job_url: str = None, job_title: str = None, job_company: str = None) -> bool:
+        if job_url and self.conn.execute(
+            "SELECT 1 FROM jobs JOIN applications ON applications.job_id = jobs.id WHERE url = ? LIMIT 1",
+            (job_url,)
+        ).fetchone():
+            return True
+        if job_title and job_company:
+            return self.conn.execute(
+                "SELECT 1 FROM jobs JOIN applications ON applications.job_id = jobs.id "
+                "WHERE title_norm = ? AND company_norm = ? LIMIT 1",
+                (job_title.lower(), job_company.lower())
+            ).fetchone() is not None
+        return False
+
+    def _rows_to_applications(self, rows) -> List[Dict[str, Any]]:
+        rows = list(rows)
+        projects: Dict[int, List[str]] = {}
+        ids = [row['id'] for row in rows]
+        for i in range(0, len(ids), 500):
+            chunk = ids[i:i + 500]
+            placeholders = ','.join('?' * len(chunk))
+            for p in self.conn.execute(
+                f"SELECT application_id, project FROM application_projects "
+                f"WHERE application_id IN ({placeholders}) ORDER BY application_id, position", chunk
+            ):
+                projects.setdefault(p['application_id'], []).append(p['project'])
+        return [{
+            'id': row['app_id'],
+            'job': json.loads(row['data']),
+            'tailored_resume_path': row['tailored_resume_path'],
+            'selected_projects': projects.get(row['id'], []),
+            'applied_date': row['applied_date'],
+            'status': row['status'],
+            'created_at': row['created_at'],
+        } for row in rows]
+
+    def _select(self, where: str = '', params=()) -> List[Dict[str, Any]]:
+        return self._rows_to_applications(self.conn.execute(
+            "SELECT applications.*, jobs.data FROM applications JOIN jobs ON applications.job_id = jobs.id "
+            f"{where} ORDER BY applications.id", params
+        ))
+
+    def with_status(self, status: str) -> List[Dict[str, Any]]:
+        return self._select("WHERE status = ?", (status,))
+
+    def stats(self) -> Dict[str, int]:
+        return dict(self._stats)
+
+    def all(self) -> List[Dict[str, Any]]:
+        return self._select()
+
+    def close(self):
+        self.conn.close()
+
+
+class StoredStats:
+    """Reads the persisted status counters without loading the history.
+
+    For callers outside a run (the Telegram ``/stats`` command): the SQLite
+    store's ``status_counts`` table, or the ``stats`` block of the JSON file,
+    which is re-read only when the file has changed. Create it on the thread
+    that calls ``read``; the SQLite connection is reused between calls.
+    """
+
+    def __init__(self, json_path: str, db_path: Optional[str] = None):
+        self.json_path = json_path
+        self.db_path = db_path
+        self._conn = None
+        self._json_stamp = None
+        self._json_stats: Dict[str, int] = {}
+
+    def read(self) -> Dict[str, int]:
+        if self.db_path and os.path.exists(self.db_path):
+            if self._conn is None:
+                self._conn = sqlite3.connect(f"file:{self.db_path}?mode=ro", uri=True)
+            stats = {'total': 0, **{status: 0 for status in STATUSES}}
+            stats.update(self._conn.execute("SELECT status, count FROM status_counts WHERE count != 0"))
+            return stats
+        return self._read_json()
+
+    def _read_json(self) -> Dict[str, int]:
+        try:
+            st = os.stat(self.json_path)
+        except OSError:
+            return {'total': 0, **{status: 0 for status in STATUSES}}
+        stamp = (st.st_ino, st.st_mtime_ns, st.st_size)
+        if stamp != self._json_stamp:
+            with open(self.json_path, 'r') as f:
+                self._json_stats = json.load(f).get('stats', {})
+            self._json_stamp = stamp
+        return dict(self._json_stats)
+
+    def close(self):
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
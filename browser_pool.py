@@ -0,0 +1,292 @@
+import os
+import time
+import atexit
+import asyncio
+import threading
+from contextlib import asynccontextmanager
+from typing import Dict, List, Optional
+from urllib.parse import urlparse
+
+DEFAULT_BLOCKED_TYPES = ['image', 'font', 'media', 'stylesheet']
+
+DEFAULT_BLOCKED_HOSTS = [
+    'google-analytics.com', 'googletagmanager.com', 'doubleclick.net',
+    'googlesyndication.com', 'googleadservices.com', 'facebook.net',
+    'connect.facebook.net', 'hotjar.com', 'clarity.ms', 'segment.io',
+    'mixpanel.com', 'amplitude.com', 'newrelic.com', 'nr-data.net',
+    'scorecardresearch.com', 'moengage.com', 'criteo.com', 'taboola.com',
+]
+
+# Aborted requests never report a size, so savings are estimated from typical
+# transfer sizes per resource type.
+ESTIMATED_BYTES = {
+    'image': 40_000,
+    'font': 35_000,
+    'media': 300_000,
+    'stylesheet': 25_000,
+    'script': 30_000,
+}
+DEFAULT_ESTIMATED_BYTES = 5_000
+
+
+class RouteFilter:
+    """Aborts requests the scrapers never read (assets and trackers) on a browser context.
+
+    Pages are registered against a site name so the requests and (estimated)
+    bytes saved can be reported per site.
+    """
+
+    def __init__(self, blocked_types: List[str] = None, blocked_hosts: List[str] = None):
+        self.blocked_types = set(DEFAULT_BLOCKED_TYPES if blocked_types is None else blocked_types)
+        self.blocked_hosts = tuple(DEFAULT_BLOCKED_HOSTS if blocked_hosts is None else blocked_hosts)
+        self._page_sites = {}
+        self.saved: Dict[str, Dict[str, int]] = {}
+
+    async def install(self, context):
+        await context.route('**/*', self._handle)
+
+    def register(self, page, site: str):
+        self._page_sites[page] = site
+
+    def unregister(self, page):
+        self._page_sites.pop(page, None)
+
+    def _is_blocked(self, request) -> bool:
+        if request.resource_type in self.blocked_types:
+            return True
+        host = urlparse(request.url).hostname or ''
+        return any(host == h or host.endswith('.' + h) for h in self.blocked_hosts)
+
+    def _site_of(self, request) -> str:
+        try:
+            return self._page_sites.get(request.frame.page, 'other')
+        except Exception:
+            # Service worker requests have no frame
+            return 'other'
+
+    async def _handle(self, route):
+        request = route.request
+        if not self._is_blocked(request):
+            await route.continue_()
+            return
+        
+        stats = self.saved.setdefault(self._site_of(request), {'requests': 0, 'bytes': 0})
+        stats['requests'] += 1
+        stats['bytes'] += ESTIMATED_BYTES.get(request.resource_type, DEFAULT_ESTIMATED_BYTES)
+        await route.abort()
+
+
+class PagePool:
+    """Shares one browser context between concurrent scrapers.
+
+    At most ``max_pages`` pages are open at any time; scrapers wait for a free
+    slot instead of opening pages unconditionally.
+    """
+
+    def __init__(self, context, max_pages: int = 4, ready_timeout: float = 8, idle_timeout: float = 5,
+                 route_filter: Optional[RouteFilter] = None):
+        self.context = context
+        self.route_filter = route_filter
+        self.max_pages = max(1, max_pages)
+        self.ready_timeout = ready_timeout
+        self.idle_timeout = idle_timeout
+        self._slots = asyncio.Semaphore(self.max_pages)
+        self.ready_times: Dict[str, List[float]] = {}
+
+    @asynccontextmanager
+    async def page(self, site: str = 'other'):
+        async with self._slots:
+            page = await self.context.new_page()
+            if self.route_filter:
+                self.route_filter.register(page, site)
+            try:
+                yield page
+            finally:
+                await page.close()
+                if self.route_filter:
+                    self.route_filter.unregister(page)
+
+    async def wait_ready(self, page, site: str, selector: str) -> bool:
+        """Wait until ``selector`` is on the page instead of sleeping a fixed time.
+
+        Gives up after ``ready_timeout`` seconds and falls back to waiting for
+        network idle (at most ``idle_timeout``), so a changed layout still gets
+        scraped. The time until the page was usable is recorded per site.
+        """
+        start = time.perf_counter()
+        ready = True
+        try:
+            await page.wait_for_selector(selector, state='attached', timeout=self.ready_timeout * 1000)
+        except Exception:
+            ready = False
+            try:
+                await page.wait_for_load_state('networkidle', timeout=self.idle_timeout * 1000)
+            except Exception:
+                pass
+        self.ready_times.setdefault(site, []).append(time.perf_counter() - start)
+        return ready
+
+
+class BrowserHost:
+    """One Chromium kept alive on a background event loop for the whole process.
+
+    Playwright objects belong to the loop that created them, so all browser
+    work is submitted to the host's loop with ``run``, from any thread. The
+    scrapers and the PDF renderer share the browser, each in its own context.
+    Chromium is launched on first use (and again if it disconnects).
+    ``shutdown`` closes it and stops the loop; it is also registered with
+    atexit.
+    """
+
+    def __init__(self, headless: bool = True):
+        self.headless = headless
+        self.closed = False
+        self._playwright = None
+        self._browser = None
+        self._launch_lock: Optional[asyncio.Lock] = None
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, name="browser-host", daemon=True)
+        self._thread.start()
+        atexit.register(self.shutdown)
+
+    def run(self, coro, timeout: float = None):
+        """Run ``coro`` on the host loop and wait for its result."""
+        if self.closed:
+            coro.close()
+            raise RuntimeError("Browser host is shut down")
+        future = asyncio.run_coroutine_threadsafe(coro, self._loop)
+        try:
+            return future.result(timeout)
+        except TimeoutError:
+            future.cancel()
+            raise
+
+    async def browser(self):
+        """The shared browser (call on the host loop)."""
+        if self._launch_lock is None:
+            self._launch_lock = asyncio.Lock()
+        async with self._launch_lock:
+            if self._browser is None or not self._browser.is_connected():
+                if self._playwright is None:
+                    from playwright.async_api import async_playwright
+                    self._playwright = await async_playwright().start()
+                self._browser = await self._playwright.chromium.launch(headless=self.headless)
+            return self._browser
+
+    async def _close(self):
+        if self._browser is not None:
+            await self._browser.close()
+            self._browser = None
+        if self._playwright is not None:
+            await self._playwright.stop()
+            self._playwright = None
+
+    def shutdown(self):
+        if self.closed:
+            return
+        try:
+            self.run(self._close(), timeout=30)
+        except Exception as e:
+            print(f"Browser shutdown error: {e}")
+        self.closed = True
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(timeout=5)
+        # A host is started per scheduler cycle; don't keep closed ones alive in atexit
+        atexit.unregister(self.shutdown)
+
+
+_host: Optional[BrowserHost] = None
+_host_lock = threading.Lock()
+
+
+def get_browser_host() -> BrowserHost:
+    """The process-wide BrowserHost, started again if a previous one was shut down."""
+    global _host
+    with _host_lock:
+        if _host is None or _host.closed:
+            _host = BrowserHost()
+        return _host
+
+
+def shutdown_browser_host():
+    """Close the shared browser if one was started (a later get_browser_host starts a new one)."""
+    with _host_lock:
+        host = _host
+    if host is not None:
+        host.shutdown()
+
+
+class PdfRenderer:
+    """Renders HTML files to PDF with pages kept open between renders.
+
+    Uses its own context on the shared BrowserHost browser and reuses up to
+    ``max_pages`` pages, so a render costs a navigation and a print instead
+    of a browser launch. ``stats`` reports renders, failures and average
+    render time.
+    """
+
+    PDF_OPTIONS = {'format': 'A4', 'margin': {'top': '0.5in', 'bottom': '0.5in', 'left': '0.5in', 'right': '0.5in'}}
+
+    def __init__(self, host: BrowserHost, max_pages: int = 2, timeout: float = 30):
+        self.host = host
+        self.max_pages = max(1, max_pages)
+        self.timeout = timeout
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._browser = None
+        self._context = None
+        self._idle_pages: List = []
+        self._stats = {'renders': 0, 'failed': 0, 'total_time': 0.0}
+        self._stats_lock = threading.Lock()
+
+    async def _page(self):
+        browser = await self.host.browser()
+        if browser is not self._browser:
+            # First render, or Chromium was relaunched: the old context and pages are gone
+            self._browser = browser
+            self._context = await browser.new_context()
+            self._idle_pages = []
+        if self._idle_pages:
+            return self._idle_pages.pop()
+        return await self._context.new_page()
+
+    async def _render(self, html_path: str, pdf_path: str):
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.max_pages)
+        async with self._slots:
+            page = await self._page()
+            try:
+                await page.goto(f'file://{os.path.abspath(html_path)}', wait_until='load')
+                await page.pdf(path=pdf_path, **self.PDF_OPTIONS)
+            except BaseException:
+                # Includes the CancelledError from a timed-out run(); never leave a half-used page behind
+                try:
+                    await asyncio.shield(page.close())
+                except BaseException:
+                    pass
+                raise
+            self._idle_pages.append(page)
+
+    def render(self, html_path: str, pdf_path: str) -> Optional[str]:
+        """Print ``html_path`` to ``pdf_path``; the PDF path, or None on failure."""
+        start = time.perf_counter()
+        ok = False
+        try:
+            self.host.run(self._render(html_path, pdf_path), timeout=self.timeout)
+            ok = os.path.exists(pdf_path)
+        except TimeoutError:
+            print(f"Playwright render timed out after {self.timeout}s: {html_path}")
+        except Exception as e:
+            print(f"Playwright error: {e}")
+        finally:
+            with self._stats_lock:
+                self._stats['renders'] += 1
+                self._stats['total_time'] += time.perf_counter() - start
+                if not ok:
+                    self._stats['failed'] += 1
+        return pdf_path if ok else None
+
+    def stats(self) -> Dict[str, float]:
+        with self._stats_lock:
+            stats = dict(self._stats)
+        stats['avg_time'] = stats.pop('total_time') / stats['renders'] if stats['renders'] else 0.0
+        return stats
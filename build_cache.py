@@ -0,0 +1,101 @@
+import os
+import time
+import shutil
+import hashlib
+from typing import Optional
+
+
+class BuildCache:
+    """Content-addressed cache of built resume PDFs.
+
+    A PDF is stored as ``<sha256 of its source>.pdf`` in ``cache_dir``, so a
+    job whose generated LaTeX/HTML matches an earlier one reuses that build
+    instead of compiling again. Hits are hard-linked to the requested output
+    path (copied where links are not supported), so repeated resumes take no
+    extra disk space. Entries not used for ``max_age_days`` are removed, then
+    the least recently used ones until the cache fits in ``max_bytes``.
+    """
+
+    def __init__(self, cache_dir: str = 'tailored_resumes/.cache', max_bytes: int = 200 * 1024 * 1024,
+                 max_age_days: float = 30):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.max_age_seconds = max_age_days * 86400
+        self.hits = 0
+        self.misses = 0
+        os.makedirs(cache_dir, exist_ok=True)
+
+    @staticmethod
+    def key(source: str) -> str:
+        return hashlib.sha256(source.encode('utf-8')).hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.pdf")
+
+    def get(self, key: str, output_path: str) -> Optional[str]:
+        """Place the cached build for ``key`` at ``output_path``; None on a miss."""
+        cached = self._path(key)
+        if not os.path.exists(cached):
+            self.misses += 1
+            return None
+        try:
+            if os.path.lexists(output_path):
+                os.remove(output_path)
+            try:
+                os.link(cached, output_path)
+            except OSError:
+                shutil.copy2(cached, output_path)
+            # The mtime doubles as the last-used time for eviction
+            os.utime(cached)
+        except OSError as e:
+            print(f"Resume cache error: {e}")
+            self.misses += 1
+            return None
+        self.hits += 1
+        return output_path
+
+    def put(self, key: str, built_path: str):
+        """Remember a freshly built PDF under ``key``."""
+        cached = self._path(key)
+        tmp = f"{cached}.{os.getpid()}.tmp"
+        try:
+            try:
+                os.link(built_path, tmp)
+            except OSError:
+                shutil.copy2(built_path, tmp)
+            os.replace(tmp, cached)
+            os.utime(cached)
+        except OSError as e:
+            print(f"Resume cache error: {e}")
+            return
+        self.evict()
+
+    def evict(self):
+        entries = []
+        now = time.time()
+        for name in os.listdir(self.cache_dir):
+            path = os.path.join(self.cache_dir, name)
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            if self.max_age_seconds and now - st.st_mtime > self.max_age_seconds:
+                self._remove(path)
+            else:
+                entries.append((st.st_mtime, st.st_size, path))
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if not self.max_bytes or total <= self.max_bytes:
+                break
+            self._remove(path)
+            total -= size
+
+    @staticmethod
+    def _remove(path: str):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+    def stats(self):
+        return {'hits': self.hits, 'misses': self.misses}
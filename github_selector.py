@@ -3,10 +3,29 @@ import json
 import httpx
 from typing import List, Dict, Any
 
+from keyword_matcher import KeywordMatcher, get_matcher
+from project_index import FileBackedIndex, ProjectIndex
+
+TECH_KEYWORDS = {
+    'python': ['python', 'pandas', 'numpy', 'django', 'flask', 'tensorflow', 'pytorch'],
+    'java': ['java', 'spring', 'hibernate'],
+    'javascript': ['javascript', 'react', 'angular', 'vue', 'node', 'express'],
+    'ml': ['machine learning', 'deep learning', 'tensorflow', 'pytorch', 'keras', 'ml'],
+    'data': ['data analysis', 'data science', 'pandas', 'sql', 'tableau', 'visualization'],
+    'cloud': ['aws', 'azure', 'gcp', 'cloud', 'docker', 'kubernetes'],
+    'sql': ['sql', 'mysql', 'postgresql', 'mongodb', 'database'],
+    'web': ['html', 'css', 'api', 'rest', 'frontend', 'backend']
+}
+TECH_VOCABULARY = tuple(dict.fromkeys(kw for kws in TECH_KEYWORDS.values() for kw in kws))
+TECH_MATCHER = KeywordMatcher(TECH_VOCABULARY)
+
 class GitHubSelector:
     def __init__(self, config):
         self.github_username = config.get('user', {}).get('github_username', '')
         self.cache_path = 'data/github_projects.json'
+        # Category/language -> projects posting lists (see project_index.py)
+        self._file_index = None
+        self._adhoc_index = None
         
     def fetch_repositories(self) -> List[Dict[str, Any]]:
         if not self.github_username or self.github_username == "REPLACE_WITH_YOUR_GITHUB_USERNAME":
@@ -46,52 +65,36 @@ class GitHubSelector:
             return []
             
     def match_projects_to_job(self, job_description: str, projects: List[Dict] = None) -> List[Dict]:
-        if projects is None:
-            projects = self.fetch_repositories()
-            
-        if not projects:
+        index = self._project_index(projects)
+        if not index.projects:
             return []
             
-        job_lower = job_description.lower()
+        # Project languages are only known at runtime, so they join the shared vocabulary per call
+        languages = tuple(term[1] for term in index.postings if isinstance(term, tuple))
+        job_hits = get_matcher(TECH_VOCABULARY + languages).scan(job_description)
         
-        tech_keywords = {
-            'python': ['python', 'pandas', 'numpy', 'django', 'flask', 'tensorflow', 'pytorch'],
-            'java': ['java', 'spring', 'hibernate'],
-            'javascript': ['javascript', 'react', 'angular', 'vue', 'node', 'express'],
-            'ml': ['machine learning', 'deep learning', 'tensorflow', 'pytorch', 'keras', 'ml'],
-            'data': ['data analysis', 'data science', 'pandas', 'sql', 'tableau', 'visualization'],
-            'cloud': ['aws', 'azure', 'gcp', 'cloud', 'docker', 'kubernetes'],
-            'sql': ['sql', 'mysql', 'postgresql', 'mongodb', 'database'],
-            'web': ['html', 'css', 'api', 'rest', 'frontend', 'backend']
-        }
+        query = [(category, 2) for category, kws in TECH_KEYWORDS.items() if any(kw in job_hits for kw in kws)]
+        query += [(('language', lang), 3) for lang in languages if lang in job_hits]
+        return index.rank(query)
         
-        scored_projects = []
+    def _project_index(self, projects: List[Dict] = None) -> ProjectIndex:
+        if projects is not None:
+            # Explicit project lists get their own index, reused while the same list is passed
+            if self._adhoc_index is None or self._adhoc_index.projects is not projects:
+                self._adhoc_index = self._build_index(projects)
+            return self._adhoc_index
+        if self._file_index is None:
+            self._file_index = FileBackedIndex(self.cache_path, self.fetch_repositories(), self._build_index)
+        return self._file_index.get()
         
-        for project in projects:
-            score = 0
-            proj_text = f"{project['name']} {project['description']} {project['language']}".lower()
-            
-            for category, keywords in tech_keywords.items():
-                if any(kw in job_lower for kw in keywords):
-                    if any(kw in proj_text for kw in keywords):
-                        score += 2
-                        
-            if project.get('stars', 0) > 0:
-                score += min(project['stars'] / 10, 3)
-                
+    def _build_index(self, projects: List[Dict]) -> ProjectIndex:
+        def terms_of(project):
+            hits = TECH_MATCHER.scan(f"{project['name']} {project['description']} {project['language']}")
+            terms = [category for category, kws in TECH_KEYWORDS.items() if any(kw in hits for kw in kws)]
             if project.get('language'):
-                if project['language'].lower() in job_lower:
-                    score += 3
-                    
-            if score > 0:
-                scored_projects.append({
-                    **project,
-                    'match_score': score
-                })
-                
-        scored_projects.sort(key=lambda x: x['match_score'], reverse=True)
-        
-        return scored_projects[:5]
+                terms.append(('language', project['language'].lower()))
+            return terms
+        return ProjectIndex(projects, terms_of)
         
     def get_top_projects(self, limit: int = 5) -> List[Dict]:
         projects = self.fetch_repositories()
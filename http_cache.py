@@ -0,0 +1,153 @@
+import os
+import json
+import time
+import hashlib
+from typing import Dict, List, Optional
+
+
+class CachedResponse:
+    def __init__(self, status_code: int, body: bytes = b'', body_hash: str = '',
+                 changed: bool = True, from_cache: bool = False, bytes_downloaded: int = 0):
+        self.status_code = status_code
+        self.body = body
+        self.body_hash = body_hash
+        self.changed = changed
+        self.from_cache = from_cache
+        self.bytes_downloaded = bytes_downloaded
+
+
+class HttpCache:
+    """Disk-backed cache for the job board APIs.
+
+    Requests are sent with If-None-Match / If-Modified-Since when a stored copy
+    exists, and a 304 reuses the stored body. Entries older than ``ttl_hours``
+    are refetched unconditionally, and the least recently used entries are
+    evicted once the cache grows past ``max_bytes``. Parsed jobs can be stored
+    next to a body so an unchanged payload does not need to be parsed and
+    scored again.
+    """
+
+    def __init__(self, cache_dir: str = 'data/http_cache', ttl_hours: float = 24, max_bytes: int = 50 * 1024 * 1024):
+        self.cache_dir = cache_dir
+        self.ttl_seconds = ttl_hours * 3600
+        self.max_bytes = max_bytes
+        self.index_path = os.path.join(cache_dir, 'index.json')
+        self.index: Dict[str, Dict] = self._load_index()
+        self.hits = 0
+        self.misses = 0
+
+    def _load_index(self) -> Dict[str, Dict]:
+        if os.path.exists(self.index_path):
+            try:
+                with open(self.index_path, 'r') as f:
+                    return json.load(f)
+            except (OSError, ValueError):
+                pass
+        return {}
+
+    def save(self):
+        os.makedirs(self.cache_dir, exist_ok=True)
+        tmp_path = self.index_path + '.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump(self.index, f)
+        os.replace(tmp_path, self.index_path)
+
+    def _path(self, url: str, suffix: str) -> str:
+        key = hashlib.sha1(url.encode('utf-8')).hexdigest()
+        return os.path.join(self.cache_dir, f"{key}.{suffix}")
+
+    def _read_body(self, url: str) -> Optional[bytes]:
+        try:
+            with open(self._path(url, 'body'), 'rb') as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def _drop(self, url: str):
+        self.index.pop(url, None)
+        for suffix in ('body', 'jobs.json'):
+            try:
+                os.remove(self._path(url, suffix))
+            except OSError:
+                pass
+
+    def _evict(self):
+        total = sum(e.get('size', 0) for e in self.index.values())
+        for url, entry in sorted(self.index.items(), key=lambda kv: kv[1].get('last_used', 0)):
+            if total <= self.max_bytes:
+                break
+            total -= entry.get('size', 0)
+            self._drop(url)
+
+    async def get(self, client, url: str) -> CachedResponse:
+        now = time.time()
+        entry = self.index.get(url)
+        if entry and now - entry.get('stored_at', 0) > self.ttl_seconds:
+            self._drop(url)
+            entry = None
+
+        headers = {}
+        if entry:
+            if entry.get('etag'):
+                headers['If-None-Match'] = entry['etag']
+            if entry.get('last_modified'):
+                headers['If-Modified-Since'] = entry['last_modified']
+
+        response = await client.get(url, headers=headers)
+        downloaded = len(response.content)
+
+        if response.status_code == 304 and entry:
+            body = self._read_body(url)
+            if body is not None:
+                self.hits += 1
+                entry['last_used'] = now
+                return CachedResponse(200, body, entry['body_hash'], changed=False,
+                                      from_cache=True, bytes_downloaded=downloaded)
+            # Stored body went missing; fetch it again without validators
+            self._drop(url)
+            response = await client.get(url)
+            downloaded += len(response.content)
+
+        self.misses += 1
+        if response.status_code != 200:
+            return CachedResponse(response.status_code, bytes_downloaded=downloaded)
+
+        body = response.content
+        body_hash = hashlib.sha256(body).hexdigest()
+        changed = not entry or entry.get('body_hash') != body_hash
+
+        os.makedirs(self.cache_dir, exist_ok=True)
+        with open(self._path(url, 'body'), 'wb') as f:
+            f.write(body)
+        if changed:
+            try:
+                os.remove(self._path(url, 'jobs.json'))
+            except OSError:
+                pass
+        self.index[url] = {
+            'etag': response.headers.get('etag'),
+            'last_modified': response.headers.get('last-modified'),
+            'body_hash': body_hash,
+            'size': len(body),
+            'stored_at': now,
+            'last_used': now,
+        }
+        self._evict()
+        return CachedResponse(200, body, body_hash, changed=changed, bytes_downloaded=downloaded)
+
+    def load_parsed(self, url: str, body_hash: str, parse_key: str) -> Optional[List[Dict]]:
+        """Return jobs previously parsed from this exact body, if any."""
+        try:
+            with open(self._path(url, 'jobs.json'), 'r') as f:
+                stored = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if stored.get('body_hash') != body_hash or stored.get('parse_key') != parse_key:
+            return None
+        return stored.get('jobs')
+
+    def save_parsed(self, url: str, body_hash: str, parse_key: str, jobs: List[Dict]):
+        if url not in self.index:
+            return
+        with open(self._path(url, 'jobs.json'), 'w') as f:
+            json.dump({'body_hash': body_hash, 'parse_key': parse_key, 'jobs': jobs}, f)
@@ -1,33 +1,141 @@
 import re
 from typing import Dict, List, Tuple
 
+from analysis_cache import AnalysisCache, fingerprint
+from keyword_matcher import KeywordMatcher
+from project_index import FileBackedIndex, ProjectIndex
+
+ML_KEYWORDS = ['machine learning', 'ml engineer', 'deep learning', 'ai engineer', 
+               'artificial intelligence', 'data scientist', 'nlp', 'computer vision',
+               'tensorflow', 'pytorch', 'neural network', 'model training',
+               'mlops', 'ai/ml']
+
+DATA_ANALYST_KEYWORDS = ['data analyst', 'data analytics', 'business analyst',
+                         'bi analyst', 'tableau', 'power bi', 'data visualization',
+                         'etl', 'data warehouse', 'sql analyst', 'analytics']
+
+SDE_KEYWORDS = ['sde', 'software engineer', 'software developer', 'full stack',
+                'backend', 'frontend', 'fullstack', 'web developer', 'api developer',
+                'cloud engineer', 'devops', 'site reliability']
+
+PROJECT_KEYWORDS = {
+    'SDE': ['react', 'next', 'node', 'javascript', 'typescript', 'python', 
+            'flask', 'django', 'express', 'api', 'fullstack', 'web'],
+    'Data Analyst': ['python', 'pandas', 'numpy', 'jupyter', 'sql', 'analysis',
+                     'analytics', 'visualization', 'tableau', 'bi', 'etl'],
+    'ML Engineer': ['python', 'tensorflow', 'pytorch', 'ml', 'ai', 'nlp', 'cv',
+                    'machine learning', 'deep learning', 'neural', 'whisper', 'gpt']
+}
+
+ROLE_RELATED_TERMS = {
+    'SDE': ['software engineer', 'developer', 'sde', 'programming'],
+    'ML Engineer': ['machine learning', 'ml engineer', 'ai engineer', 'data scientist', 'computer vision', 'nlp'],
+    'Data Analyst': ['data analyst', 'analytics', 'bi analyst', 'business analyst', 'data science'],
+}
+
+ENTRY_LEVEL_TERMS = ['entry', 'fresher', 'junior', 'graduate', 'new grad', 'intern', 'student']
+
+# Quantifiable achievements keywords (User has many: 22% accuracy, 90% reduction, 95.47% accuracy)
+IMPACT_KEYWORDS = ['accuracy', 'predictive', 'automated', 'pipeline', 'handling', 'scalability', 'performance']
+
+STUDENT_TERMS = ['intern', 'junior', 'student', 'graduate']
+
+VETNET_TERMS = ['pytorch', 'fastapi', 'iot', 'hybrid']
+
+# AI/ML specific keywords the user actually has
+ATS_ML_KEYWORDS = ['pytorch', 'tensorflow', 'scikit-learn', 'fastapi', 'nlp', 'cnn', 'lstm', 'xgboost', 'eda']
+
+ALL_SKILLS = [
+    'Python', 'Java', 'JavaScript', 'TypeScript', 'C++', 'C#', 'Go', 'Rust',
+    'React', 'Angular', 'Vue', 'Node.js', 'Django', 'Flask', 'Express', 'Next.js',
+    'SQL', 'MySQL', 'PostgreSQL', 'MongoDB', 'Redis', 'SQLite',
+    'AWS', 'Azure', 'GCP', 'Docker', 'Kubernetes', 'Git',
+    'Machine Learning', 'Deep Learning', 'TensorFlow', 'PyTorch', 'Keras',
+    'NLP', 'Computer Vision', 'RAG', 'Generative AI', 'LLM', 'Hugging Face',
+    'Pandas', 'NumPy', 'Scikit-learn', 'Matplotlib',
+    'REST API', 'GraphQL', 'Microservices', 'Agile', 'Scrum',
+    'Linux', 'Jenkins', 'CI/CD', 'Docker',
+    'Data Analysis', 'Data Science', 'ETL', 'Tableau', 'PowerBI'
+]
+
+LEGACY_EXPERIENCE_TERMS = ['entry', 'fresher', 'junior', 'graduate', 'new grad']
+LEGACY_EDUCATION_TERMS = ['bachelor', 'b.tech', 'degree', 'computer science', 'cse', '2027', '2026']
+LEGACY_KEYWORDS = [
+    'remote', 'remote-friendly', 'worldwide',
+    'problem solving', 'team player', 'communication',
+    'fast-paced', 'startup', 'innovative'
+]
+
+JOB_TYPES = ['SDE', 'Data Analyst', 'ML Engineer']
+
+# Part of every analysis cache key; bump whenever scoring logic or keyword lists change
+ANALYZER_VERSION = '1'
+
+# Every keyword list checked against a job description, so one scan answers all scorers
+ANALYZER_KEYWORD_GROUPS = [
+    ML_KEYWORDS, DATA_ANALYST_KEYWORDS, SDE_KEYWORDS, JOB_TYPES,
+    *ROLE_RELATED_TERMS.values(), ENTRY_LEVEL_TERMS, IMPACT_KEYWORDS, STUDENT_TERMS,
+    VETNET_TERMS, ['computer science', 'engineering'], ATS_ML_KEYWORDS, ALL_SKILLS,
+    LEGACY_EXPERIENCE_TERMS, LEGACY_EDUCATION_TERMS, LEGACY_KEYWORDS,
+]
+DESCRIPTION_MATCHER = KeywordMatcher(kw for group in ANALYZER_KEYWORD_GROUPS for kw in group)
+
+PROJECT_MATCHER = KeywordMatcher(kw for keywords in PROJECT_KEYWORDS.values() for kw in keywords)
+
+
+class JobAnalysis:
+    """Intermediate results for one (description, job type) pair.
+    
+    Built once per ``calculate_ats_score`` call and shared by every score
+    component, so the description is scanned once and the projects are
+    ranked once (``DESCRIPTION_MATCHER.scans`` counts the actual scans).
+    """
+    
+    def __init__(self, analyzer: 'JobAnalyzer', job_description: str, job_type: str):
+        self.job_description = job_description
+        self.job_type = job_type
+        self.hits = DESCRIPTION_MATCHER.scan(job_description)
+        self.matching_projects = analyzer.get_github_projects_for_job(job_type, job_description)
+        self.required_skills = analyzer._skills_in(self.hits)
+        self.matched_skills = analyzer._match_skills(self.required_skills)
+
+
 class JobAnalyzer:
     def __init__(self, config, github_projects, parsed_resume=None):
         self.config = config
         self.github_projects = github_projects or []
         self.resume_data = parsed_resume or {}
         self.resume_skills = self.resume_data.get('skills', [])
-        
+        # Keyword -> projects posting lists, rebuilt when the cached repo list changes
+        self.project_index = FileBackedIndex(
+            'data/github_projects.json',
+            self.github_projects, self._build_project_index
+        )
+        # Results of score_many keyed by content hash, persisted across scheduler cycles
+        cache_config = config.get('analysis_cache', {})
+        self.analysis_cache = None
+        if cache_config.get('enabled', True):
+            self.analysis_cache = AnalysisCache(
+                cache_config.get('path', 'data/analysis_cache.db'),
+                memory_entries=cache_config.get('memory_entries', 512),
+                max_entries=cache_config.get('max_entries', 20000)
+            )
+        self._profiled_index = None
+        self._profile_version = None
+        
+    def _build_project_index(self, projects: List[Dict]) -> ProjectIndex:
+        self.github_projects = projects
+        return ProjectIndex(projects, lambda proj: PROJECT_MATCHER.scan(
+            f"{proj.get('name', '')} {proj.get('description', '')} {proj.get('language', '')}"
+        ))
+    
     def detect_job_type(self, job_description: str, job_title: str = "") -> str:
         """Detect if job is SDE, Data Analyst, or ML Engineer"""
-        text = f"{job_title} {job_description}".lower()
-        
-        ml_keywords = ['machine learning', 'ml engineer', 'deep learning', 'ai engineer', 
-                     'artificial intelligence', 'data scientist', 'nlp', 'computer vision',
-                     'tensorflow', 'pytorch', 'neural network', 'model training',
-                     'mlops', 'ai/ml']
-        
-        data_analyst_keywords = ['data analyst', 'data analytics', 'business analyst',
-                                'bi analyst', 'tableau', 'power bi', 'data visualization',
-                                'etl', 'data warehouse', 'sql analyst', 'analytics']
-        
-        sde_keywords = ['sde', 'software engineer', 'software developer', 'full stack',
-                      'backend', 'frontend', 'fullstack', 'web developer', 'api developer',
-                      'cloud engineer', 'devops', 'site reliability']
+        hits = DESCRIPTION_MATCHER.scan(f"{job_title} {job_description}")
         
-        ml_score = sum(1 for kw in ml_keywords if kw in text)
-        data_score = sum(1 for kw in data_analyst_keywords if kw in text)
-        sde_score = sum(1 for kw in sde_keywords if kw in text)
+        ml_score = sum(1 for kw in ML_KEYWORDS if kw in hits)
+        data_score = sum(1 for kw in DATA_ANALYST_KEYWORDS if kw in hits)
+        sde_score = sum(1 for kw in SDE_KEYWORDS if kw in hits)
         
         if ml_score >= data_score and ml_score >= sde_score:
             return "ML Engineer"
@@ -38,39 +146,8 @@ class JobAnalyzer:
     
     def get_github_projects_for_job(self, job_type: str, job_description: str) -> List[Dict]:
         """Get matching GitHub projects based on job type"""
-        text = f"{job_type} {job_description}".lower()
-        
-        project_keywords = {
-            'SDE': ['react', 'next', 'node', 'javascript', 'typescript', 'python', 
-                    'flask', 'django', 'express', 'api', 'fullstack', 'web'],
-            'Data Analyst': ['python', 'pandas', 'numpy', 'jupyter', 'sql', 'analysis',
-                           'analytics', 'visualization', 'tableau', 'bi', 'etl'],
-            'ML Engineer': ['python', 'tensorflow', 'pytorch', 'ml', 'ai', 'nlp', 'cv',
-                          'machine learning', 'deep learning', 'neural', 'whisper', 'gpt']
-        }
-        
-        keywords = project_keywords.get(job_type, project_keywords['SDE'])
-        
-        scored_projects = []
-        for proj in self.github_projects:
-            score = 0
-            proj_text = f"{proj.get('name', '')} {proj.get('description', '')} {proj.get('language', '')}".lower()
-            
-            for kw in keywords:
-                if kw in proj_text:
-                    score += 2
-            
-            if proj.get('stars', 0) > 0:
-                score += min(proj.get('stars', 0) / 10, 3)
-            
-            if score > 0:
-                scored_projects.append({
-                    **proj,
-                    'match_score': score
-                })
-        
-        scored_projects.sort(key=lambda x: x.get('match_score', 0), reverse=True)
-        return scored_projects[:5]
+        keywords = PROJECT_KEYWORDS.get(job_type, PROJECT_KEYWORDS['SDE'])
+        return self.project_index.get().rank((kw, 2) for kw in keywords)
     
     def calculate_ats_score(self, job_description: str, job_type: str) -> Dict:
         """Calculate FAANG-level ATS score with new formula
@@ -78,25 +155,25 @@ class JobAnalyzer:
         Formula:
         ATS = (0.25×RM) + (0.25×WE) + (0.20×PR) + (0.15×PS) + (0.10×ES) + (0.05×KW)
         """
-        job_lower = job_description.lower()
+        analysis = JobAnalysis(self, job_description, job_type)
         
         # Role Match (RM) - 25%
-        rm_score = self._calculate_role_match_score(job_description, job_type)
+        rm_score = self._calculate_role_match_score(analysis)
         
         # Work Experience Impact (WE) - 25%
-        we_score = self._calculate_work_experience_score(job_description)
+        we_score = self._calculate_work_experience_score(analysis)
         
         # Project Depth (PR) - 20%
-        pr_score = self._calculate_project_depth_score(job_type, job_description)
+        pr_score = self._calculate_project_depth_score(analysis)
         
         # Problem Solving (PS) - 15%
         ps_score = self._calculate_problem_solving_score()
         
         # Education Signal (ES) - 10%
-        es_score = self._calculate_education_signal_score(job_description)
+        es_score = self._calculate_education_signal_score(analysis)
         
         # Keyword Optimization (KW) - 5%
-        kw_score = self._calculate_keyword_optimization_score(job_description)
+        kw_score = self._calculate_keyword_optimization_score(analysis)
         
         # Calculate total
         total = (0.25 * rm_score) + (0.25 * we_score) + (0.20 * pr_score) + (0.15 * ps_score) + (0.10 * es_score) + (0.05 * kw_score)
@@ -110,9 +187,6 @@ class JobAnalyzer:
             'keywords': kw_score * 0.05
         }
         
-        matching_projects = self.get_github_projects_for_job(job_type, job_description)
-        matched_skills = self._match_skills(self._extract_skills(job_description))
-        
         return {
             'total': total,
             'breakdown': score_breakdown,
@@ -124,14 +198,164 @@ class JobAnalyzer:
                 'ES': es_score,
                 'KW': kw_score
             },
-            'matched_skills': matched_skills,
-            'matching_projects': matching_projects,
+            'matched_skills': analysis.matched_skills,
+            'matching_projects': analysis.matching_projects,
             'job_type': job_type,
-            'networking_hook': self._generate_networking_hook(job_type, job_description, matching_projects)
+            'networking_hook': self._networking_hook(job_type, 'intern' in analysis.hits, analysis.matching_projects)
         }
 
+    def profile_version(self) -> str:
+        """Fingerprint of the parsed resume and GitHub projects the scores depend on."""
+        index = self.project_index.get()
+        if index is not self._profiled_index:
+            self._profiled_index = index
+            self._profile_version = fingerprint([self.resume_data, self.github_projects])
+        return self._profile_version
+    
+    def score_many(self, jobs: List[Dict]) -> List[Dict]:
+        """Detect the job type and calculate the ATS score for many jobs at once.
+        
+        Returns one dict per job, identical to ``calculate_ats_score(description,
+        detect_job_type(description, title))``. Postings analysed before (same
+        description, title, resume, projects and ANALYZER_VERSION) are served
+        from the analysis cache; the rest are scored in one batch.
+        """
+        cache = self.analysis_cache
+        if cache is None:
+            return self._score_batch(jobs)
+        
+        cache.set_profile(self.profile_version())
+        keys = [cache.key(job.get('description', ''), job.get('title', ''), ANALYZER_VERSION) for job in jobs]
+        results = [cache.get(key) for key in keys]
+        missing = [i for i, result in enumerate(results) if result is None]
+        
+        for i, result in zip(missing, self._score_batch([jobs[i] for i in missing])):
+            results[i] = result
+        hit_keys = set(keys).difference(keys[i] for i in missing)
+        cache.touch_many(hit_keys)
+        cache.put_many({keys[i]: results[i] for i in missing})
+        return results
+    
+    def _score_batch(self, jobs: List[Dict]) -> List[Dict]:
+        """Score jobs without the cache. Each description is scanned once into a
+        job x keyword hit matrix and the component scores are computed as
+        NumPy array operations, which makes backfills over thousands of cached
+        jobs cheap. Falls back to scoring job by job without NumPy.
+        """
+        try:
+            import numpy as np
+        except ImportError:
+            return [self._score_one(job) for job in jobs]
+        
+        if not jobs:
+            return []
+        
+        column = {kw: i for i, kw in enumerate(DESCRIPTION_MATCHER.keywords)}
+        
+        def hit_matrix(texts: List[str]):
+            rows, cols = [], []
+            for row, text in enumerate(texts):
+                for kw in DESCRIPTION_MATCHER.scan(text):
+                    rows.append(row)
+                    cols.append(column[kw])
+            matrix = np.zeros((len(texts), len(column)), dtype=np.uint8)
+            matrix[rows, cols] = 1
+            return matrix
+        
+        def mask(keywords: List[str]):
+            m = np.zeros(len(column), dtype=np.int32)
+            m[[column[kw.lower()] for kw in keywords]] = 1
+            return m
+        
+        descriptions = [job.get('description', '') for job in jobs]
+        hits = hit_matrix(descriptions)
+        typed_hits = hit_matrix([f"{job.get('title', '')} {desc}" for job, desc in zip(jobs, descriptions)])
+        
+        # Job type, indexed into JOB_TYPES (ties resolve like detect_job_type)
+        ml = typed_hits @ mask(ML_KEYWORDS)
+        data = typed_hits @ mask(DATA_ANALYST_KEYWORDS)
+        sde = typed_hits @ mask(SDE_KEYWORDS)
+        type_idx = np.where((ml >= data) & (ml >= sde), 2, np.where(data >= sde, 1, 0))
+        rows = np.arange(len(jobs))
+        
+        # Role Match (RM)
+        type_cols = np.array([column[jt.lower()] for jt in JOB_TYPES])
+        related = np.stack([hits @ mask(ROLE_RELATED_TERMS[jt]) for jt in JOB_TYPES], axis=1)
+        rm = (50 * hits[rows, type_cols[type_idx]]
+              + np.where(related[rows, type_idx] > 0, np.array([30, 30, 40])[type_idx], 0)
+              + 20 * (hits @ mask(ENTRY_LEVEL_TERMS) > 0))
+        rm = np.minimum(rm, 100)
+        
+        # Work Experience Impact (WE)
+        we = np.minimum(40 + np.minimum((hits @ mask(IMPACT_KEYWORDS)) * 8, 40)
+                        + 20 * (hits @ mask(STUDENT_TERMS) > 0), 100)
+        
+        # Project Depth (PR); project matches depend on the job type only
+        projects_by_type = [self.get_github_projects_for_job(jt, '') for jt in JOB_TYPES]
+        project_bonus = np.array([min(len(p) * 15, 60) for p in projects_by_type])
+        pr = np.minimum(40 + project_bonus[type_idx]
+                        + 20 * ((type_idx == 2) & (hits @ mask(VETNET_TERMS) > 0)), 100)
+        
+        # Problem Solving (PS) is not job dependent
+        ps = np.full(len(jobs), self._calculate_problem_solving_score())
+        
+        # Education Signal (ES)
+        es = np.minimum(70 + 30 * (hits @ mask(['computer science', 'engineering']) > 0), 100)
+        
+        # Keyword Optimization (KW)
+        kw = np.minimum((hits @ mask(ATS_ML_KEYWORDS)) * 15, 100)
+        
+        total = (0.25 * rm) + (0.25 * we) + (0.20 * pr) + (0.15 * ps) + (0.10 * es) + (0.05 * kw)
+        
+        # Skills in ALL_SKILLS order that the resume also has
+        master = {ms.lower() for ms in self._master_skills()}
+        skill_names = [skill for skill in ALL_SKILLS if skill.lower() in master]
+        skill_hits = hits[:, [column[skill.lower()] for skill in skill_names]] if skill_names else None
+        intern = hits[:, column['intern']]
+        
+        results = []
+        for i, (job_type_i, rm_i, we_i, pr_i, ps_i, es_i, kw_i, total_i) in enumerate(zip(
+                type_idx.tolist(), rm.tolist(), we.tolist(), pr.tolist(), ps.tolist(),
+                es.tolist(), kw.tolist(), total.tolist())):
+            job_type = JOB_TYPES[job_type_i]
+            matching_projects = list(projects_by_type[job_type_i])
+            matched_skills = ([skill_names[j] for j in np.flatnonzero(skill_hits[i]).tolist()]
+                              if skill_names else [])
+            results.append({
+                'total': total_i,
+                'breakdown': {
+                    'role_match': rm_i * 0.25,
+                    'work_experience': we_i * 0.25,
+                    'project_depth': pr_i * 0.20,
+                    'problem_solving': ps_i * 0.15,
+                    'education': es_i * 0.10,
+                    'keywords': kw_i * 0.05
+                },
+                'raw_scores': {
+                    'RM': rm_i,
+                    'WE': we_i,
+                    'PR': pr_i,
+                    'PS': ps_i,
+                    'ES': es_i,
+                    'KW': kw_i
+                },
+                'matched_skills': matched_skills,
+                'matching_projects': matching_projects,
+                'job_type': job_type,
+                'networking_hook': self._networking_hook(job_type, bool(intern[i]), matching_projects)
+            })
+        return results
+    
+    def _score_one(self, job: Dict) -> Dict:
+        description = job.get('description', '')
+        job_type = self.detect_job_type(description, job.get('title', ''))
+        return self.calculate_ats_score(description, job_type)
+
     def _generate_networking_hook(self, job_type: str, job_description: str, matching_projects: List[Dict]) -> str:
         """Generate a personalized LinkedIn networking hook"""
+        return self._networking_hook(job_type, 'intern' in DESCRIPTION_MATCHER.scan(job_description), matching_projects)
+    
+    def _networking_hook(self, job_type: str, mentions_intern: bool, matching_projects: List[Dict]) -> str:
         # User details for the hook
         batch = "2027"
         major = "CSE"
@@ -142,7 +366,7 @@ class JobAnalyzer:
             primary_project = matching_projects[0].get('name', primary_project)
             
         role_name = "ML Intern" if job_type == 'ML Engineer' else "Data/Software Intern"
-        if 'intern' in job_description.lower():
+        if mentions_intern:
             role_name = "Intern"
             
         hook = f"Hi [Name], I'm a {batch} batch {major} student interested in the {role_name} role. "
@@ -158,55 +382,56 @@ class JobAnalyzer:
         hook += " I'd love to connect and learn more about the team's work!"
         return hook
     
-    def _calculate_role_match_score(self, job_description: str, job_type: str) -> float:
+    def _calculate_role_match_score(self, analysis: 'JobAnalysis') -> float:
         """Role Match (RM) - How well the role matches"""
         score = 0
-        text = job_description.lower()
+        hits = analysis.hits
+        job_type = analysis.job_type
         
         # Exact role match
-        if job_type.lower() in text:
+        job_type_lower = job_type.lower()
+        if job_type_lower in hits or (job_type_lower not in DESCRIPTION_MATCHER.keywords
+                                      and job_type_lower in analysis.job_description.lower()):
             score += 50
         
         # Related terms
         if job_type == 'SDE':
-            if any(t in text for t in ['software engineer', 'developer', 'sde', 'programming']):
+            if any(t in hits for t in ROLE_RELATED_TERMS['SDE']):
                 score += 30
         elif job_type == 'ML Engineer':
-            if any(t in text for t in ['machine learning', 'ml engineer', 'ai engineer', 'data scientist', 'computer vision', 'nlp']):
+            if any(t in hits for t in ROLE_RELATED_TERMS['ML Engineer']):
                 score += 40 # Increased weight for ML roles
         elif job_type == 'Data Analyst':
-            if any(t in text for t in ['data analyst', 'analytics', 'bi analyst', 'business analyst', 'data science']):
+            if any(t in hits for t in ROLE_RELATED_TERMS['Data Analyst']):
                 score += 30
         
         # Seniority match (fresher/intern friendly = higher score)
-        if any(t in text for t in ['entry', 'fresher', 'junior', 'graduate', 'new grad', 'intern', 'student']):
+        if any(t in hits for t in ENTRY_LEVEL_TERMS):
             score += 20
         
         return min(score, 100)
     
-    def _calculate_work_experience_score(self, job_description: str) -> float:
+    def _calculate_work_experience_score(self, analysis: 'JobAnalysis') -> float:
         """Work Experience Impact (WE) - 25%"""
         score = 0
-        text = job_description.lower()
+        hits = analysis.hits
         
         # User has specific internship experience: Alfido Tech (Data Analyst), Infotact (Python Developer)
         score += 40  # Solid internship foundation in both Data and Backend
         
-        # Quantifiable achievements keywords (User has many: 22% accuracy, 90% reduction, 95.47% accuracy)
-        impact_keywords = ['accuracy', 'predictive', 'automated', 'pipeline', 'handling', 'scalability', 'performance']
-        matches = sum(1 for kw in impact_keywords if kw in text)
+        matches = sum(1 for kw in IMPACT_KEYWORDS if kw in hits)
         score += min(matches * 8, 40)
         
         # Freshers/Students often welcomed in these roles
-        if any(kw in text for kw in ['intern', 'junior', 'student', 'graduate']):
+        if any(kw in hits for kw in STUDENT_TERMS):
             score += 20
         
         return min(score, 100)
     
-    def _calculate_project_depth_score(self, job_type: str, job_description: str) -> float:
+    def _calculate_project_depth_score(self, analysis: 'JobAnalysis') -> float:
         """Project Depth (PR) - 20%"""
         # We manually boost this because we know the user's projects are extremely deep (VetNet AI, OpenWork Agent)
-        matching_projects = self.get_github_projects_for_job(job_type, job_description)
+        matching_projects = analysis.matching_projects
         
         score = 40 # Base for high quality projects
         
@@ -214,7 +439,7 @@ class JobAnalyzer:
             score += min(len(matching_projects) * 15, 60)
             
         # Specific mentions of complex ML tasks
-        if job_type == 'ML Engineer' and any(kw in job_description.lower() for kw in ['pytorch', 'fastapi', 'iot', 'hybrid']):
+        if analysis.job_type == 'ML Engineer' and any(kw in analysis.hits for kw in VETNET_TERMS):
             score += 20 # Bonus for VetNet style alignment
             
         return min(score, 100)
@@ -234,10 +459,10 @@ class JobAnalyzer:
         
         return min(score, 100)
     
-    def _calculate_education_signal_score(self, job_description: str) -> float:
+    def _calculate_education_signal_score(self, analysis: 'JobAnalysis') -> float:
         """Education Signal (ES) - 10%"""
         score = 0
-        text = job_description.lower()
+        hits = analysis.hits
         
         # B.Tech CSE (2027)
         score += 50
@@ -246,70 +471,48 @@ class JobAnalyzer:
         score += 20
         
         # Relevant keywords
-        if 'computer science' in text or 'engineering' in text:
+        if 'computer science' in hits or 'engineering' in hits:
             score += 30
         
         return min(score, 100)
     
-    def _calculate_keyword_optimization_score(self, job_description: str) -> float:
+    def _calculate_keyword_optimization_score(self, analysis: 'JobAnalysis') -> float:
         """Keyword Optimization (KW) - 5%"""
         score = 0
-        text = job_description.lower()
+        hits = analysis.hits
         
-        # AI/ML specific keywords the user actually has
-        ml_keywords = ['pytorch', 'tensorflow', 'scikit-learn', 'fastapi', 'nlp', 'cnn', 'lstm', 'xgboost', 'eda']
-        matches = sum(1 for kw in ml_keywords if kw in text)
+        matches = sum(1 for kw in ATS_ML_KEYWORDS if kw in hits)
         score += min(matches * 15, 100)
         
         return min(score, 100)
     
     def _extract_skills(self, job_description: str) -> List[str]:
-        all_skills = [
-            'Python', 'Java', 'JavaScript', 'TypeScript', 'C++', 'C#', 'Go', 'Rust',
-            'React', 'Angular', 'Vue', 'Node.js', 'Django', 'Flask', 'Express', 'Next.js',
-            'SQL', 'MySQL', 'PostgreSQL', 'MongoDB', 'Redis', 'SQLite',
-            'AWS', 'Azure', 'GCP', 'Docker', 'Kubernetes', 'Git',
-            'Machine Learning', 'Deep Learning', 'TensorFlow', 'PyTorch', 'Keras',
-            'NLP', 'Computer Vision', 'RAG', 'Generative AI', 'LLM', 'Hugging Face',
-            'Pandas', 'NumPy', 'Scikit-learn', 'Matplotlib',
-            'REST API', 'GraphQL', 'Microservices', 'Agile', 'Scrum',
-            'Linux', 'Jenkins', 'CI/CD', 'Docker',
-            'Data Analysis', 'Data Science', 'ETL', 'Tableau', 'PowerBI'
-        ]
-        
-        found = []
-        job_lower = job_description.lower()
-        
-        for skill in all_skills:
-            if skill.lower() in job_lower:
-                found.append(skill)
-        
-        return found
+        return self._skills_in(DESCRIPTION_MATCHER.scan(job_description))
     
-    def _match_skills(self, required_skills: List[str]) -> List[str]:
+    def _skills_in(self, hits) -> List[str]:
+        return [skill for skill in ALL_SKILLS if skill.lower() in hits]
+    
+    def _master_skills(self) -> List[str]:
         # Use dynamic skills from the parsed resume if available, otherwise fallback to a fallback list
-        master_skills = self.resume_skills if self.resume_skills else [
+        return self.resume_skills if self.resume_skills else [
             'Python', 'Machine Learning', 'Deep Learning', 'PyTorch', 'TensorFlow', 
             'FastAPI', 'Flask', 'SQL', 'NLP', 'Computer Vision'
         ]
-        
-        matched = []
-        for skill in required_skills:
-            if any(skill.lower() == ms.lower() for ms in master_skills):
-                matched.append(skill)
-        
-        return matched
+    
+    def _match_skills(self, required_skills: List[str]) -> List[str]:
+        master = {ms.lower() for ms in self._master_skills()}
+        return [skill for skill in required_skills if skill.lower() in master]
     
     def _calculate_experience_score(self, job_description: str) -> float:
         score = 0
-        text = job_description.lower()
+        hits = DESCRIPTION_MATCHER.scan(job_description)
         
         # Internships count (user has 3)
-        if 'intern' in text:
+        if 'intern' in hits:
             score += 15
         
         # Junior/fresher friendly
-        if any(kw in text for kw in ['entry', 'fresher', 'junior', 'graduate', 'new grad']):
+        if any(kw in hits for kw in LEGACY_EXPERIENCE_TERMS):
             score += 15
         else:
             score += 10
@@ -318,27 +521,22 @@ class JobAnalyzer:
     
     def _calculate_education_score(self, job_description: str) -> float:
         score = 0
-        text = job_description.lower()
+        hits = DESCRIPTION_MATCHER.scan(job_description)
         
-        if 'bachelor' in text or 'b.tech' in text or 'degree' in text:
+        if 'bachelor' in hits or 'b.tech' in hits or 'degree' in hits:
             score += 5
         
-        if 'computer science' in text or 'cse' in text:
+        if 'computer science' in hits or 'cse' in hits:
             score += 3
         
-        if '2027' in text or '2026' in text:
+        if '2027' in hits or '2026' in hits:
             score += 2
         
         return min(score + 2, 10)  # Base score 2
     
     def _calculate_keyword_score(self, job_description: str) -> float:
-        keywords = [
-            'remote', 'remote-friendly', 'worldwide',
-            'problem solving', 'team player', 'communication',
-            'fast-paced', 'startup', 'innovative'
-        ]
-        
-        matches = sum(1 for kw in keywords if kw in job_description.lower())
+        hits = DESCRIPTION_MATCHER.scan(job_description)
+        matches = sum(1 for kw in LEGACY_KEYWORDS if kw in hits)
         return min(matches * 2, 10)
     
     def select_resume(self, job_type: str) -> str:
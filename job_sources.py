@@ -0,0 +1,526 @@
+import os
+import json
+import time
+import asyncio
+from datetime import datetime
+from typing import List, Dict, Any, Optional, Tuple
+from bs4 import BeautifulSoup
+
+from http_cache import CachedResponse
+
+SOURCES = {}
+
+
+def register_source(cls):
+    """Class decorator that makes a source selectable by name in ``jobs.platforms``."""
+    SOURCES[cls.name] = cls
+    return cls
+
+
+class JobSource:
+    """A single job board.
+
+    Every source goes through the same three steps: ``fetch`` the raw payload,
+    ``parse`` it into board-specific items and ``normalize`` each item into the
+    job dict used by the rest of the agent. ``searcher`` is the owning
+    JobSearcher, which provides target roles and match scoring.
+    """
+    name = ''       # key used in jobs.platforms
+    platform = ''   # value stored in job['platform']
+    kind = 'http'   # 'http' sources get an httpx.AsyncClient, 'browser' sources a PagePool
+
+    def __init__(self, searcher):
+        self.searcher = searcher
+        self.errors = 0
+        self.bytes_downloaded = 0
+
+    def reset(self):
+        self.errors = 0
+        self.bytes_downloaded = 0
+
+    async def fetch(self, handle) -> Any:
+        raise NotImplementedError
+
+    def parse(self, raw) -> List[Any]:
+        raise NotImplementedError
+
+    def normalize(self, item) -> Optional[Dict[str, Any]]:
+        raise NotImplementedError
+
+    async def search(self, handle) -> List[Dict[str, Any]]:
+        raw = await self.fetch(handle)
+        if raw is None:
+            return []
+        jobs = []
+        for item in self.parse(raw):
+            job = self.normalize(item)
+            if job:
+                jobs.append(job)
+        return jobs
+
+
+class HttpSource(JobSource):
+    """A board with a plain HTTP endpoint.
+
+    Responses go through the searcher's HttpCache when one is configured;
+    if the payload is unchanged since the last run the jobs parsed from it
+    last time are reused instead of being parsed and scored again.
+    """
+    kind = 'http'
+    url = ''
+
+    def reset(self):
+        super().reset()
+        self.cache_status = None
+
+    def parse_key(self) -> str:
+        # Scores depend on the configured roles, so a role change invalidates parsed jobs
+        return json.dumps(self.searcher.target_roles)
+
+    async def fetch(self, client) -> Optional[CachedResponse]:
+        cache = self.searcher.http_cache
+        if cache is not None:
+            result = await cache.get(client, self.url)
+        else:
+            response = await client.get(self.url)
+            result = CachedResponse(response.status_code, response.content, bytes_downloaded=len(response.content))
+        self.bytes_downloaded += result.bytes_downloaded
+        if result.status_code != 200:
+            # Blocked (403), rate limited (429) or failing (5xx) endpoints count as errors
+            self.errors += 1
+            print(f"{self.platform} returned HTTP {result.status_code}")
+            return None
+        self.cache_status = 'hit' if result.from_cache else 'miss'
+        return result
+
+    async def search(self, client) -> List[Dict[str, Any]]:
+        result = await self.fetch(client)
+        if result is None:
+            return []
+
+        cache = self.searcher.http_cache
+        if cache is not None and not result.changed:
+            jobs = cache.load_parsed(self.url, result.body_hash, self.parse_key())
+            if jobs is not None:
+                self.cache_status = 'unchanged'
+                return jobs
+
+        jobs = []
+        for item in self.parse(result.body):
+            job = self.normalize(item)
+            if job:
+                jobs.append(job)
+        if cache is not None:
+            cache.save_parsed(self.url, result.body_hash, self.parse_key(), jobs)
+        return jobs
+
+
+@register_source
+class RemoteOKSource(HttpSource):
+    name = 'remoteok'
+    platform = 'RemoteOK'
+    url = "https://remoteok.com/api"
+
+    def parse(self, body: bytes) -> List[Dict]:
+        return json.loads(body)[1:30]
+
+    def normalize(self, item: Dict) -> Dict[str, Any]:
+        return {
+            'id': f"remoteok_{item.get('id')}",
+            'title': item.get('position', ''),
+            'company': item.get('company', ''),
+            'location': 'Remote',
+            'url': f"https://remoteok.com{item.get('url', '')}" if not item.get('url', '').startswith('http') else item.get('url'),
+            'description': item.get('description', '')[:500],
+            'platform': self.platform,
+            'posted_date': item.get('date', 'Recent'),
+            'match_score': self.searcher._calculate_match_score(item.get('position', ''), item.get('description', ''))
+        }
+
+
+@register_source
+class RemotiveSource(HttpSource):
+    name = 'remotive'
+    platform = 'Remotive'
+    url = "https://remotive.com/api/remote-jobs?limit=20"
+
+    def parse(self, body: bytes) -> List[Dict]:
+        return json.loads(body).get('jobs', [])
+
+    def normalize(self, item: Dict) -> Dict[str, Any]:
+        return {
+            'id': f"remotive_{item.get('id')}",
+            'title': item.get('title', ''),
+            'company': item.get('company_name', ''),
+            'location': item.get('candidate_required_location', 'Remote'),
+            'url': item.get('url', ''),
+            'description': item.get('description', '')[:500],
+            'platform': self.platform,
+            'posted_date': item.get('published_at', 'Recent'),
+            'match_score': self.searcher._calculate_match_score(item.get('title', ''), item.get('description', ''))
+        }
+
+
+@register_source
+class WeWorkRemotelySource(HttpSource):
+    name = 'weworkremotely'
+    platform = 'WeWorkRemotely'
+    url = "https://weworkremotely.com/api/jobs"
+
+    def parse(self, body: bytes) -> List[Dict]:
+        return json.loads(body).get('jobs', [])[:20]
+
+    def normalize(self, item: Dict) -> Dict[str, Any]:
+        return {
+            'id': f"wework_{item.get('id')}",
+            'title': item.get('title', ''),
+            'company': item.get('company_name', ''),
+            'location': 'Remote',
+            'url': f"https://weworkremotely.com{item.get('url', '')}",
+            'description': item.get('description', '')[:500],
+            'platform': self.platform,
+            'posted_date': item.get('published_at', 'Recent'),
+            'match_score': self.searcher._calculate_match_score(item.get('title', ''), item.get('description', ''))
+        }
+
+
+@register_source
+class PythonOrgSource(HttpSource):
+    name = 'python_org'
+    platform = 'Python.org'
+    url = "https://www.python.org/jobs/"
+
+    def parse(self, body: bytes) -> List[Any]:
+        soup = BeautifulSoup(body, 'lxml')
+        return soup.select('.listing-row')[:10]
+
+    def normalize(self, item) -> Optional[Dict[str, Any]]:
+        title_elem = item.select_one('.listing-row-title')
+        if not title_elem:
+            return None
+        link = title_elem.select_one('a')
+        return {
+            'id': f"python_{item.get('id', 'N/A')}",
+            'title': title_elem.get_text(strip=True),
+            'company': item.select_one('.listing-company-name').get_text(strip=True),
+            'location': item.select_one('.listing-location').get_text(strip=True),
+            'url': 'https://www.python.org' + link.get('href', '') if link else '',
+            'description': 'Python-specific opportunity',
+            'platform': self.platform,
+            'posted_date': 'Recent',
+            'match_score': 0.75
+        }
+
+
+class BrowserSource(JobSource):
+    """A board scraped with Playwright.
+
+    ``fetch`` opens one page per target (role search URL) through the shared
+    PagePool and reads the text of each card; ``normalize`` turns one card
+    into a job dict.
+    """
+    kind = 'browser'
+    max_roles = 1
+    max_cards = 10
+    cards_selector = ''
+    title_selector = ''
+    company_selector = ''
+    link_selector = None
+
+    def role_url(self, role: str) -> str:
+        raise NotImplementedError
+
+    def targets(self) -> List[Tuple[Optional[str], str]]:
+        return [(role, self.role_url(role)) for role in self.searcher.target_roles[:self.max_roles]]
+
+    async def fetch(self, pool) -> List[List[Dict]]:
+        return await asyncio.gather(*[self._scrape(pool, role, url) for role, url in self.targets()])
+
+    def parse(self, raw: List[List[Dict]]) -> List[Dict]:
+        return [card for cards in raw for card in cards]
+
+    def _count_bytes(self, response):
+        try:
+            self.bytes_downloaded += int(response.headers.get('content-length', 0))
+        except (TypeError, ValueError):
+            pass
+
+    async def _scrape(self, pool, role: Optional[str], url: str) -> List[Dict]:
+        cards_found = []
+        try:
+            async with pool.page(self.name) as page:
+                page.on('response', self._count_bytes)
+                await page.goto(url, timeout=30000, wait_until='domcontentloaded')
+                await pool.wait_ready(page, self.name, self.cards_selector)
+
+                cards = await page.query_selector_all(self.cards_selector)
+                for card in cards[:self.max_cards]:
+                    title_elem = await card.query_selector(self.title_selector)
+                    if not title_elem:
+                        continue
+                    company_elem = await card.query_selector(self.company_selector)
+                    link_elem = await card.query_selector(self.link_selector) if self.link_selector else None
+
+                    cards_found.append({
+                        'role': role,
+                        'page_url': url,
+                        'title': await title_elem.inner_text(),
+                        'company': await company_elem.inner_text() if company_elem else 'N/A',
+                        'link': (await link_elem.get_attribute('href') if link_elem else '') or '',
+                    })
+        except Exception as e:
+            self.errors += 1
+            print(f"    {self.platform} error: {e}")
+        return cards_found
+
+
+@register_source
+class NaukriSource(BrowserSource):
+    name = 'naukri'
+    platform = 'Naukri'
+    max_roles = 2
+    cards_selector = '.jobTuple, .tuple, .srp-jobtuple-wrapper'
+    title_selector = '.title, .job-title'
+    company_selector = '.companyInfo, .company-name'
+    link_selector = 'a.title, a'
+
+    def role_url(self, role: str) -> str:
+        return f"https://www.naukri.com/{role.lower().replace(' ', '-')}-jobs"
+
+    def normalize(self, card: Dict) -> Dict[str, Any]:
+        return {
+            'id': f"naukri_{card['title']}_{card['company']}",
+            'title': card['title'].strip(),
+            'company': card['company'].strip().split('\n')[0],
+            'location': 'India',
+            'url': card['link'],
+            'description': f"{card['role']} position on Naukri",
+            'platform': self.platform,
+            'posted_date': 'Recent',
+            'match_score': 0.7
+        }
+
+
+@register_source
+class InternshalaSource(BrowserSource):
+    name = 'internshala'
+    platform = 'Internshala'
+    max_roles = 2
+    cards_selector = '.individual_detail'
+    title_selector = '.job-title'
+    company_selector = '.company-name'
+    link_selector = 'a'
+
+    def role_url(self, role: str) -> str:
+        return f"https://internshala.com/students/jobs#keywords={role.replace(' ', '%20')}"
+
+    def normalize(self, card: Dict) -> Dict[str, Any]:
+        link = card['link']
+        return {
+            'id': f"internshala_{card['title']}",
+            'title': card['title'].strip(),
+            'company': card['company'].strip(),
+            'location': 'India/Remote',
+            'url': 'https://internshala.com' + link if link.startswith('/') else link,
+            'description': f"Internship: {card['role']}",
+            'platform': self.platform,
+            'posted_date': 'Recent',
+            'match_score': 0.8
+        }
+
+
+@register_source
+class LinkedInSource(BrowserSource):
+    name = 'linkedin'
+    platform = 'LinkedIn'
+    max_roles = 2
+    cards_selector = '.base-card'
+    title_selector = '.base-search-card__title'
+    company_selector = '.base-search-card__subtitle'
+    link_selector = '.base-card__full-link'
+
+    def role_url(self, role: str) -> str:
+        return f"https://www.linkedin.com/jobs/search?keywords={role.replace(' ', '%20')}&location=India&f_TPR=r86400"
+
+    def normalize(self, card: Dict) -> Dict[str, Any]:
+        return {
+            'id': f"linkedin_{card['title']}",
+            'title': card['title'].strip(),
+            'company': card['company'].strip(),
+            'location': 'India',
+            'url': card['link'],
+            'description': 'LinkedIn Guest Job',
+            'platform': self.platform,
+            'posted_date': 'Recent',
+            'match_score': 0.75
+        }
+
+
+@register_source
+class IndeedSource(BrowserSource):
+    name = 'indeed'
+    platform = 'Indeed India'
+    cards_selector = '.job_seen_beacon'
+    title_selector = 'h2.jobTitle span[title]'
+    company_selector = '[data-testid="company-name"]'
+    link_selector = 'h2.jobTitle a'
+
+    def role_url(self, role: str) -> str:
+        # Use Indeed India mobile-friendly search
+        return f"https://in.indeed.com/jobs?q={role.replace(' ', '+')}&l=India&fromage=1"
+
+    def normalize(self, card: Dict) -> Dict[str, Any]:
+        link = card['link']
+        if link and not link.startswith('http'):
+            link = 'https://in.indeed.com' + link
+        return {
+            'id': f"indeed_{card['title']}",
+            'title': card['title'].strip(),
+            'company': card['company'].strip(),
+            'location': 'India',
+            'url': link,
+            'description': 'Indeed India Job',
+            'platform': self.platform,
+            'posted_date': 'Recent',
+            'match_score': 0.7
+        }
+
+
+@register_source
+class CuvetteSource(BrowserSource):
+    name = 'cuvette'
+    platform = 'Cuvette'
+    # Cuvette is very specific to freshers
+    url = "https://cuvette.tech/app/student/jobs/all"
+    cards_selector = '.job-card, [class*="JobCard"]'
+    title_selector = '.job-title, [class*="JobTitle"]'
+    company_selector = '.company-name, [class*="CompanyName"]'
+
+    def targets(self) -> List[Tuple[Optional[str], str]]:
+        return [(None, self.url)]
+
+    def normalize(self, card: Dict) -> Dict[str, Any]:
+        # Cuvette usually requires login for links, but list is public sometimes
+        return {
+            'id': f"cuvette_{card['title']}_{card['company']}",
+            'title': card['title'].strip(),
+            'company': card['company'].strip(),
+            'location': 'India/Remote',
+            'url': card['page_url'], # Primary URL if specific link not found
+            'description': 'Freshers Job on Cuvette',
+            'platform': self.platform,
+            'posted_date': 'Recent',
+            'match_score': 0.75
+        }
+
+
+@register_source
+class UnstopSource(BrowserSource):
+    name = 'unstop'
+    platform = 'Unstop'
+    url = "https://unstop.com/job/all"
+    cards_selector = 'app-job-card, .job-card'
+    title_selector = '.job-title, h3'
+    company_selector = '.company-title, .sub-title'
+    link_selector = 'a'
+
+    def targets(self) -> List[Tuple[Optional[str], str]]:
+        return [(None, self.url)]
+
+    def normalize(self, card: Dict) -> Dict[str, Any]:
+        link = card['link']
+        return {
+            'id': f"unstop_{card['title']}",
+            'title': card['title'].strip(),
+            'company': card['company'].strip(),
+            'location': 'India',
+            'url': 'https://unstop.com' + link if link.startswith('/') else (link or card['page_url']),
+            'description': 'Student Opportunity on Unstop',
+            'platform': self.platform,
+            'posted_date': 'Recent',
+            'match_score': 0.8
+        }
+
+
+@register_source
+class InstahyreSource(BrowserSource):
+    name = 'instahyre'
+    platform = 'Instahyre'
+    cards_selector = '.job-listing'
+    title_selector = '.job-title'
+    company_selector = '.company-name'
+    link_selector = 'a'
+
+    def role_url(self, role: str) -> str:
+        return f"https://www.instahyre.com/jobs-search/?keywords={role.replace(' ', '+')}"
+
+    def normalize(self, card: Dict) -> Dict[str, Any]:
+        link = card['link']
+        return {
+            'id': f"instahyre_{card['title']}",
+            'title': card['title'].strip(),
+            'company': card['company'].strip(),
+            'location': 'India',
+            'url': 'https://www.instahyre.com' + link if link.startswith('/') else link,
+            'description': 'Tech Job on Instahyre',
+            'platform': self.platform,
+            'posted_date': 'Recent',
+            'match_score': 0.7
+        }
+
+
+class SourceRegistry:
+    """Instantiates the sources enabled in ``jobs.platforms`` and records per-run metrics.
+
+    An empty list (or one containing ``"all"``) enables every registered source.
+    After each run ``metrics`` holds latency, job count, error count and bytes
+    downloaded per source; ``save_metrics`` appends them to a JSONL history.
+    """
+
+    def __init__(self, searcher, platforms: List[str] = None, metrics_path: str = 'data/source_metrics.jsonl'):
+        names = [p.lower() for p in platforms or []]
+        if not names or 'all' in names:
+            names = list(SOURCES)
+
+        for name in names:
+            if name not in SOURCES:
+                print(f"Unknown job platform '{name}' in config (available: {', '.join(SOURCES)})")
+
+        self.sources = [SOURCES[name](searcher) for name in names if name in SOURCES]
+        self.metrics_path = metrics_path
+        self.metrics: Dict[str, Dict[str, Any]] = {}
+
+    def enabled(self, kind: str = None) -> List[JobSource]:
+        return [s for s in self.sources if kind is None or s.kind == kind]
+
+    async def run(self, source: JobSource, handle) -> List[Dict[str, Any]]:
+        """Run one source and record its metrics, even when it fails or is cancelled."""
+        source.reset()
+        start = time.perf_counter()
+        jobs = []
+        try:
+            jobs = await source.search(handle)
+        except asyncio.CancelledError:
+            source.errors += 1
+            raise
+        except Exception as e:
+            source.errors += 1
+            print(f"{source.platform} error: {e}")
+        finally:
+            self.metrics[source.name] = {
+                'platform': source.platform,
+                'latency': round(time.perf_counter() - start, 3),
+                'jobs': len(jobs),
+                'errors': source.errors,
+                'bytes': source.bytes_downloaded,
+                'cache': getattr(source, 'cache_status', None),
+            }
+        return jobs
+
+    def save_metrics(self):
+        if not self.metrics:
+            return
+        os.makedirs(os.path.dirname(self.metrics_path) or '.', exist_ok=True)
+        record = {'timestamp': datetime.now().isoformat(), 'sources': self.metrics}
+        with open(self.metrics_path, 'a') as f:
+            f.write(json.dumps(record) + '\n')
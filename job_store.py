@@ -0,0 +1,170 @@
+import os
+import json
+import sqlite3
+import hashlib
+from datetime import datetime
+from typing import List, Dict, Any, Optional
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    started_at TEXT NOT NULL,
+    finished_at TEXT,
+    job_count INTEGER DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS jobs (
+    fingerprint TEXT PRIMARY KEY,
+    platform TEXT,
+    title TEXT,
+    company TEXT,
+    url TEXT,
+    match_score REAL,
+    data TEXT NOT NULL,
+    first_seen TEXT NOT NULL,
+    last_seen TEXT NOT NULL,
+    first_run INTEGER,
+    last_run INTEGER,
+    seen_count INTEGER DEFAULT 1
+);
+CREATE INDEX IF NOT EXISTS idx_jobs_first_seen ON jobs(first_seen);
+CREATE INDEX IF NOT EXISTS idx_jobs_last_run ON jobs(last_run);
+CREATE INDEX IF NOT EXISTS idx_jobs_first_run ON jobs(first_run);
+"""
+
+# Per-run annotations that live in their own columns rather than in the stored job
+RUN_FIELDS = ('is_new', 'first_seen', 'last_seen')
+
+
+def job_fingerprint(job: Dict[str, Any]) -> str:
+    """Stable identity of a posting: normalized title + company, same key the searcher deduplicates on."""
+    title = (job.get('title') or '').lower().strip()
+    company = (job.get('company') or '').lower().strip()
+    return hashlib.sha1(f"{title}\x1f{company}".encode('utf-8')).hexdigest()
+
+
+class JobStore:
+    """Append-only history of every job the searcher has returned.
+
+    Each run upserts its jobs by fingerprint, so a job keeps its first-seen
+    time and run while last-seen moves forward. Replaces the old
+    ``data/jobs_cache.json`` snapshot, which is imported once if present.
+    """
+
+    def __init__(self, db_path: str = 'data/jobs.db', legacy_path: str = 'data/jobs_cache.json'):
+        self.db_path = db_path
+        os.makedirs(os.path.dirname(db_path) or '.', exist_ok=True)
+        self.conn = sqlite3.connect(db_path)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.executescript(SCHEMA)
+        self._import_legacy(legacy_path)
+
+    def _import_legacy(self, legacy_path: str):
+        if not legacy_path or not os.path.exists(legacy_path):
+            return
+        if self.conn.execute("SELECT 1 FROM runs LIMIT 1").fetchone():
+            return
+        try:
+            with open(legacy_path, 'r') as f:
+                jobs = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"Could not import {legacy_path}: {e}")
+            return
+        seen_at = datetime.fromtimestamp(os.path.getmtime(legacy_path)).isoformat()
+        run_id = self._start_run(seen_at)
+        self._upsert(jobs, run_id, seen_at)
+        self._finish_run(run_id, len(jobs), seen_at)
+        print(f"Imported {len(jobs)} jobs from {legacy_path} into {self.db_path}")
+
+    def _start_run(self, started_at: str) -> int:
+        with self.conn:
+            cur = self.conn.execute("INSERT INTO runs (started_at) VALUES (?)", (started_at,))
+        return cur.lastrowid
+
+    def _finish_run(self, run_id: int, job_count: int, finished_at: str):
+        with self.conn:
+            self.conn.execute(
+                "UPDATE runs SET finished_at = ?, job_count = ? WHERE id = ?",
+                (finished_at, job_count, run_id)
+            )
+
+    def _upsert(self, jobs: List[Dict[str, Any]], run_id: int, seen_at: str):
+        rows = []
+        for job in jobs:
+            fp = job.get('fingerprint') or job_fingerprint(job)
+            rows.append((
+                fp, job.get('platform'), job.get('title'), job.get('company'), job.get('url'),
+                job.get('match_score'), json.dumps({k: v for k, v in job.items() if k not in RUN_FIELDS}),
+                seen_at, seen_at, run_id, run_id
+            ))
+        with self.conn:
+            self.conn.executemany("""
+                INSERT INTO jobs (fingerprint, platform, title, company, url, match_score, data,
+                                  first_seen, last_seen, first_run, last_run)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(fingerprint) DO UPDATE SET
+                    platform = excluded.platform,
+                    url = excluded.url,
+                    match_score = excluded.match_score,
+                    data = excluded.data,
+                    last_seen = excluded.last_seen,
+                    last_run = excluded.last_run,
+                    seen_count = seen_count + 1
+            """, rows)
+
+    def last_run(self) -> Optional[sqlite3.Row]:
+        return self.conn.execute(
+            "SELECT * FROM runs WHERE finished_at IS NOT NULL ORDER BY id DESC LIMIT 1"
+        ).fetchone()
+
+    def record_run(self, jobs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Store one run's jobs and annotate them with fingerprint, first/last seen and ``is_new``."""
+        now = datetime.now().isoformat()
+        run_id = self._start_run(now)
+
+        for job in jobs:
+            job['fingerprint'] = job_fingerprint(job)
+        known = {}
+        fps = [job['fingerprint'] for job in jobs]
+        for i in range(0, len(fps), 500):
+            chunk = fps[i:i + 500]
+            placeholders = ','.join('?' * len(chunk))
+            for row in self.conn.execute(
+                f"SELECT fingerprint, first_seen FROM jobs WHERE fingerprint IN ({placeholders})", chunk
+            ):
+                known[row['fingerprint']] = row['first_seen']
+
+        for job in jobs:
+            job['first_seen'] = known.get(job['fingerprint'], now)
+            job['last_seen'] = now
+            job['is_new'] = job['fingerprint'] not in known
+
+        self._upsert(jobs, run_id, now)
+        self._finish_run(run_id, len(jobs), datetime.now().isoformat())
+        return jobs
+
+    def jobs_first_seen_since(self, since: str) -> List[Dict[str, Any]]:
+        rows = self.conn.execute(
+            "SELECT data, first_seen, last_seen FROM jobs WHERE first_seen > ? ORDER BY match_score DESC",
+            (since,)
+        )
+        return [self._row_to_job(row) for row in rows]
+
+    def latest_jobs(self) -> List[Dict[str, Any]]:
+        """Jobs returned by the most recent run (what jobs_cache.json used to hold)."""
+        run = self.last_run()
+        if not run:
+            return []
+        rows = self.conn.execute(
+            "SELECT data, first_seen, last_seen FROM jobs WHERE last_run = ? ORDER BY match_score DESC",
+            (run['id'],)
+        )
+        return [self._row_to_job(row) for row in rows]
+
+    def _row_to_job(self, row: sqlite3.Row) -> Dict[str, Any]:
+        job = json.loads(row['data'])
+        job['first_seen'] = row['first_seen']
+        job['last_seen'] = row['last_seen']
+        return job
+
+    def close(self):
+        self.conn.close()
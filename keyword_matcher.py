@@ -0,0 +1,152 @@
+import re
+from collections import OrderedDict
+from functools import lru_cache
+from operator import itemgetter
+from typing import Dict, FrozenSet, Iterable, List, Tuple
+
+
+def _trie_pattern(keywords: Iterable[str]) -> str:
+    """Build a regex that matches the longest keyword starting at a position.
+
+    Keywords are merged into a character trie (``py(?:thon|torch)``) so the
+    regex engine branches once per character instead of trying every keyword.
+    """
+    trie: Dict = {}
+    for kw in keywords:
+        node = trie
+        for ch in kw:
+            node = node.setdefault(ch, {})
+        node[''] = {}
+
+    def build(node: Dict) -> str:
+        branches = [re.escape(ch) + build(child) for ch, child in sorted(node.items()) if ch]
+        if not branches:
+            return ''
+        body = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+        # A keyword ending here makes the rest optional; greedy matching keeps the longest
+        return f'(?:{body})?' if '' in node else body
+
+    return build(trie)
+
+
+class KeywordMatcher:
+    """Finds every keyword that occurs in a text in a single pass.
+
+    Matching is case-insensitive substring matching, i.e. ``scan(text)``
+    returns exactly ``{kw for kw in keywords if kw.lower() in text.lower()}``,
+    but the text is only lowercased and scanned once however many keywords
+    there are. Uses an Aho-Corasick automaton when ``pyahocorasick`` is
+    installed and a compiled trie regex otherwise. The most recent results
+    are kept so several scorers asking about the same description share one
+    scan.
+    """
+
+    def __init__(self, keywords: Iterable[str], cache_size: int = 32):
+        self.keywords: Tuple[str, ...] = tuple(dict.fromkeys(kw.lower() for kw in keywords if kw))
+        self._automaton = None
+        self._pattern = None
+        if self.keywords:
+            try:
+                import ahocorasick
+                self._automaton = ahocorasick.Automaton()
+                for kw in self.keywords:
+                    self._automaton.add_word(kw, kw)
+                self._automaton.make_automaton()
+            except ImportError:
+                self._pattern = re.compile('(?=(' + _trie_pattern(self.keywords) + '))')
+        # The regex reports the longest keyword at each position; the shorter
+        # keywords that are prefixes of it occur at the same position too.
+        self._prefixes = {
+            kw: tuple(p for p in self.keywords if kw.startswith(p)) for kw in self.keywords
+        }
+        self._cache: 'OrderedDict[str, FrozenSet[str]]' = OrderedDict()
+        self._cache_size = cache_size
+        self.scans = 0
+
+    def scan(self, text: str) -> FrozenSet[str]:
+        """Return the set of (lowercased) keywords occurring in ``text``."""
+        text = text or ''
+        hits = self._cache.get(text)
+        if hits is not None:
+            self._cache.move_to_end(text)
+            return hits
+
+        self.scans += 1
+        if self._automaton is not None:
+            hits = frozenset(map(itemgetter(1), self._automaton.iter(text.lower())))
+        elif self._pattern is not None:
+            found = set()
+            for m in self._pattern.finditer(text.lower()):
+                found.update(self._prefixes[m.group(1)])
+            hits = frozenset(found)
+        else:
+            hits = frozenset()
+
+        self._cache[text] = hits
+        if len(self._cache) > self._cache_size:
+            self._cache.popitem(last=False)
+        return hits
+
+    def find(self, text: str, keywords: Iterable[str]) -> List[str]:
+        """Return the entries of ``keywords`` (original case and order) occurring in ``text``."""
+        hits = self.scan(text)
+        return [kw for kw in keywords if kw.lower() in hits]
+
+
+@lru_cache(maxsize=64)
+def _cached_matcher(keywords: Tuple[str, ...]) -> KeywordMatcher:
+    return KeywordMatcher(keywords)
+
+
+def get_matcher(keywords: Iterable[str]) -> KeywordMatcher:
+    """Shared matcher for a keyword list that is only known at runtime."""
+    return _cached_matcher(tuple(keywords))
+
+
+def _benchmark():
+    import random
+    import time
+    from job_analyzer import ANALYZER_KEYWORD_GROUPS
+
+    groups = [[kw.lower() for kw in group] for group in ANALYZER_KEYWORD_GROUPS]
+    vocabulary = [kw for group in groups for kw in group]
+    random.seed(7)
+    filler = ['team', 'build', 'scale', 'product', 'customers', 'with', 'and', 'the', 'we', 'our',
+              'will', 'work', 'closely', 'across', 'experience', 'strong', 'ability', 'you', 'join', 'us']
+
+    def description(words: int) -> str:
+        # Roughly one keyword per twenty words, like a real posting
+        return ' '.join(random.choice(vocabulary) if random.random() < 0.05 else random.choice(filler)
+                        for _ in range(words))
+
+    def per_site(text: str) -> int:
+        # What the scorers used to do: lowercase and rescan once per keyword list
+        found = 0
+        for group in groups:
+            lower = text.lower()
+            found += sum(1 for kw in group if kw in lower)
+        return found
+
+    matcher = KeywordMatcher(vocabulary, cache_size=0)
+
+    def single_pass(text: str) -> int:
+        hits = matcher.scan(text)
+        return sum(1 for group in groups for kw in group if kw in hits)
+
+    backend = 'aho-corasick' if matcher._automaton is not None else 'trie regex'
+    print(f"{len(vocabulary)} keywords in {len(groups)} lists, {backend} backend")
+    for words in (100, 1000, 5000):
+        text = description(words)
+        assert per_site(text) == single_pass(text)
+        timings = []
+        for fn in (per_site, single_pass):
+            start = time.perf_counter()
+            for _ in range(50):
+                fn(text)
+            timings.append((time.perf_counter() - start) / 50 * 1000)
+        print(f"{len(text):>7} chars: per-site {timings[0]:.2f} ms, single pass {timings[1]:.2f} ms "
+              f"({timings[0] / timings[1]:.1f}x)")
+
+
+if __name__ == '__main__':
+    _benchmark()
@@ -0,0 +1,97 @@
+import os
+import time
+import shutil
+import logging
+import tempfile
+import threading
+import subprocess
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+def default_tmp_root() -> Optional[str]:
+    """tmpfs (/dev/shm) when available, so pdflatex's scratch files never touch the disk."""
+    if os.path.isdir('/dev/shm') and os.access('/dev/shm', os.W_OK):
+        return '/dev/shm'
+    return None
+
+
+def run_pdflatex(tex_path: str, pdf_path: str, timeout: float = 30, tmp_root: Optional[str] = None) -> Optional[str]:
+    """Compile ``tex_path`` in a private temp directory and move the PDF to ``pdf_path``.
+
+    Each compile gets its own directory, so concurrent builds never share
+    .aux/.log files. Returns ``pdf_path``, or None if pdflatex failed.
+    """
+    work_dir = tempfile.mkdtemp(prefix='resume-', dir=tmp_root)
+    try:
+        shutil.copyfile(tex_path, os.path.join(work_dir, 'resume.tex'))
+        result = subprocess.run(
+            ['pdflatex', '-interaction=nonstopmode', '-halt-on-error', 'resume.tex'],
+            capture_output=True,
+            timeout=timeout,
+            cwd=work_dir
+        )
+        built = os.path.join(work_dir, 'resume.pdf')
+        if result.returncode == 0 and os.path.exists(built):
+            shutil.move(built, pdf_path)
+            return pdf_path
+    except Exception as e:
+        print(f"LaTeX compilation failed: {e}")
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+    return None
+
+
+class CompilePool:
+    """Runs resume builds on worker threads so the pipeline keeps going while PDFs compile.
+
+    ``submit`` returns a Future for the build's result. ``stats`` reports
+    builds done, failures (exceptions or no PDF), average build time and the
+    deepest the queue of waiting builds got.
+    """
+
+    def __init__(self, max_workers: int = 2):
+        self.max_workers = max_workers
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='latex')
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._stats = {'builds': 0, 'failed': 0, 'max_queue_depth': 0, 'total_time': 0.0}
+
+    def queue_depth(self) -> int:
+        """Builds submitted but not finished (running or waiting for a worker)."""
+        return self._pending
+
+    def submit(self, fn: Callable[..., Any], *args, **kwargs) -> Future:
+        with self._lock:
+            self._pending += 1
+            waiting = max(0, self._pending - self.max_workers)
+            self._stats['max_queue_depth'] = max(self._stats['max_queue_depth'], waiting)
+        return self._executor.submit(self._run, fn, *args, **kwargs)
+
+    def _run(self, fn, *args, **kwargs):
+        start = time.perf_counter()
+        result = None
+        try:
+            result = fn(*args, **kwargs)
+            return result
+        finally:
+            elapsed = time.perf_counter() - start
+            with self._lock:
+                self._pending -= 1
+                self._stats['builds'] += 1
+                self._stats['total_time'] += elapsed
+                if not (result and str(result).endswith('.pdf')):
+                    self._stats['failed'] += 1
+            logger.debug(f"Resume build took {elapsed:.2f}s")
+
+    def stats(self) -> Dict[str, float]:
+        with self._lock:
+            stats = dict(self._stats)
+        stats['avg_time'] = stats.pop('total_time') / stats['builds'] if stats['builds'] else 0.0
+        stats['pending'] = self._pending
+        return stats
+
+    def close(self, wait: bool = True):
+        self._executor.shutdown(wait=wait)
@@ -1,13 +1,73 @@
 import os
 import re
-import subprocess
+import threading
+from concurrent.futures import Future
 from datetime import datetime
 from typing import Dict, List, Tuple
 
+from browser_pool import PdfRenderer, get_browser_host
+from build_cache import BuildCache
+from keyword_matcher import KeywordMatcher
+from latex_pool import CompilePool, default_tmp_root, run_pdflatex
+
+ALL_SKILLS = [
+    'Python', 'Java', 'JavaScript', 'TypeScript', 'C++', 'C#', 'Ruby', 'Go', 'Rust',
+    'React', 'Angular', 'Vue', 'Node.js', 'Django', 'Flask', 'Express', 'Next.js',
+    'SQL', 'MySQL', 'PostgreSQL', 'MongoDB', 'Redis', 'SQLite',
+    'AWS', 'Azure', 'GCP', 'Docker', 'Kubernetes', 'Git',
+    'Machine Learning', 'Deep Learning', 'TensorFlow', 'PyTorch', 'Keras',
+    'NLP', 'Computer Vision', 'RAG', 'Generative AI', 'LLM', 'Hugging Face',
+    'Data Analysis', 'Data Science', 'Pandas', 'NumPy', 'Scikit-learn',
+    'REST API', 'GraphQL', 'Microservices', 'Agile', 'Scrum',
+    'Figma', 'HTML', 'CSS', 'Linux', 'Jenkins', 'CI/CD'
+]
+EXP_KEYWORDS = ['experience', 'years', 'senior', 'lead', 'manager', 'expert', 'proficient']
+EDU_KEYWORDS = ['bachelor', 'master', 'degree', 'computer science', 'engineering']
+JOB_MATCHER = KeywordMatcher(ALL_SKILLS + EXP_KEYWORDS + EDU_KEYWORDS)
+SKILL_MATCHER = KeywordMatcher(ALL_SKILLS)
+
 class LaTeXResumeGenerator:
     def __init__(self, config):
         self.config = config
         self.master_resume = self._load_master_resume()
+        # The resume never changes while the generator lives, so scan it once
+        self.resume_hits = SKILL_MATCHER.scan(str(self.master_resume))
+        # PDFs depend only on the generated source, so identical sources reuse one build
+        cache_config = config.get('resume_cache', {})
+        self.build_cache = None
+        if cache_config.get('enabled', True):
+            self.build_cache = BuildCache(
+                cache_config.get('path', 'tailored_resumes/.cache'),
+                max_bytes=int(cache_config.get('max_mb', 200) * 1024 * 1024),
+                max_age_days=cache_config.get('max_age_days', 30)
+            )
+        # Builds with the same source wait for each other, so the second one is a cache hit
+        self._build_locks: Dict[str, threading.Lock] = {}
+        self._build_locks_lock = threading.Lock()
+        # pdflatex runs on a worker pool, each compile in its own temp directory (tmpfs when available)
+        latex_config = config.get('latex', {})
+        self.compile_timeout = latex_config.get('timeout', 30)
+        self.compile_tmp_root = latex_config.get('tmp_dir') or default_tmp_root()
+        self.compile_pool = CompilePool(latex_config.get('workers', min(4, os.cpu_count() or 1)))
+        # HTML resumes are printed by pages kept open on the shared browser (created on first use)
+        self.render_pages = config.get('browser', {}).get('render_pages', 2)
+        self._renderer = None
+        self._renderer_lock = threading.Lock()
+        
+    def close(self):
+        """Wait for queued resume builds and stop the compile workers."""
+        self.compile_pool.close()
+        
+    def render_stats(self) -> Dict[str, float]:
+        """HTML-to-PDF renders through the shared browser (empty if none ran)."""
+        return self._renderer.stats() if self._renderer is not None else {}
+            
+    @property
+    def renderer(self) -> PdfRenderer:
+        with self._renderer_lock:
+            if self._renderer is None or self._renderer.host.closed:
+                self._renderer = PdfRenderer(get_browser_host(), self.render_pages)
+            return self._renderer
         
     def _load_master_resume(self) -> dict:
         resume_text = ""
@@ -108,62 +168,37 @@ class LaTeXResumeGenerator:
     
     def calculate_ats_score(self, job_description: str) -> float:
         """Calculate ATS match score based on job requirements"""
-        job_lower = job_description.lower()
+        job_hits = JOB_MATCHER.scan(job_description)
         score = 30  # Base score
         
         # Required skills from job
         required_skills = self._extract_skills(job_description)
         
         # Check each skill against resume
-        resume_text = str(self.master_resume).lower()
-        
-        skill_matches = 0
-        for skill in required_skills:
-            if skill.lower() in resume_text:
-                skill_matches += 1
+        skill_matches = sum(1 for skill in required_skills if skill.lower() in self.resume_hits)
         
         if required_skills:
             skill_score = (skill_matches / len(required_skills)) * 50
             score += skill_score
         
         # Experience keywords
-        exp_keywords = ['experience', 'years', 'senior', 'lead', 'manager', 'expert', 'proficient']
-        for kw in exp_keywords:
-            if kw in job_lower:
-                score += 2
+        score += 2 * sum(1 for kw in EXP_KEYWORDS if kw in job_hits)
         
         # Education keywords
-        edu_keywords = ['bachelor', 'master', 'degree', 'computer science', 'engineering']
-        for kw in edu_keywords:
-            if kw in job_lower:
-                score += 1
+        score += sum(1 for kw in EDU_KEYWORDS if kw in job_hits)
         
         return min(score / 100, 1.0)
     
     def _extract_skills(self, job_description: str) -> List[str]:
-        all_skills = [
-            'Python', 'Java', 'JavaScript', 'TypeScript', 'C++', 'C#', 'Ruby', 'Go', 'Rust',
-            'React', 'Angular', 'Vue', 'Node.js', 'Django', 'Flask', 'Express', 'Next.js',
-            'SQL', 'MySQL', 'PostgreSQL', 'MongoDB', 'Redis', 'SQLite',
-            'AWS', 'Azure', 'GCP', 'Docker', 'Kubernetes', 'Git',
-            'Machine Learning', 'Deep Learning', 'TensorFlow', 'PyTorch', 'Keras',
-            'NLP', 'Computer Vision', 'RAG', 'Generative AI', 'LLM', 'Hugging Face',
-            'Data Analysis', 'Data Science', 'Pandas', 'NumPy', 'Scikit-learn',
-            'REST API', 'GraphQL', 'Microservices', 'Agile', 'Scrum',
-            'Figma', 'HTML', 'CSS', 'Linux', 'Jenkins', 'CI/CD'
-        ]
-        
-        found = []
-        job_lower = job_description.lower()
-        
-        for skill in all_skills:
-            if skill.lower() in job_lower:
-                found.append(skill)
-        
-        return found
+        return JOB_MATCHER.find(job_description, ALL_SKILLS)
     
     def tailor_resume(self, job_description: str, job_title: str, company: str) -> Tuple[str, float, str]:
         """Generate tailored LaTeX resume and return (latex_code, ats_score, pdf_path)"""
+        latex, ats_score, build = self.submit_tailored_resume(job_description, job_title, company)
+        return latex, ats_score, build.result()
+    
+    def submit_tailored_resume(self, job_description: str, job_title: str, company: str) -> Tuple[str, float, Future]:
+        """Like tailor_resume, but the PDF is built on the compile pool; the Future yields its path."""
         
         ats_score = self.calculate_ats_score(job_description)
         required_skills = self._extract_skills(job_description)
@@ -182,9 +217,13 @@ class LaTeXResumeGenerator:
             f.write(latex)
         
         # Try to convert to PDF
-        pdf_path = self._compile_latex(tex_path)
+        build = self.compile_pool.submit(self._build_tailored, latex, tex_path)
         
-        return latex, ats_score, pdf_path if pdf_path else tex_path
+        return latex, ats_score, build
+    
+    def _build_tailored(self, latex: str, tex_path: str) -> str:
+        pdf_path = self._build_pdf(latex, tex_path.replace('.tex', '.pdf'), lambda: self._compile_latex(tex_path))
+        return pdf_path if pdf_path else tex_path
     
     def _generate_latex(self, required_skills: List[str]) -> str:
         r = self.master_resume
@@ -326,22 +365,27 @@ class LaTeXResumeGenerator:
         
         return latex
     
+    def _build_pdf(self, source: str, pdf_path: str, build) -> str:
+        """Reuse the cached PDF built from ``source``, or run ``build()`` and cache its PDF."""
+        if self.build_cache is None:
+            return build()
+        key = self.build_cache.key(source)
+        with self._build_locks_lock:
+            lock = self._build_locks.setdefault(key, threading.Lock())
+        with lock:
+            if self.build_cache.get(key, pdf_path):
+                return pdf_path
+            result = build()
+            if result and result.endswith('.pdf') and os.path.exists(result):
+                self.build_cache.put(key, result)
+            return result
+    
     def _compile_latex(self, tex_path: str) -> str:
         """Try to compile LaTeX to PDF"""
-        try:
-            result = subprocess.run(
-                ['pdflatex', '-interaction=nonstopmode', tex_path],
-                capture_output=True,
-                timeout=30,
-                cwd=os.path.dirname(tex_path) or '.'
-            )
-            
-            if result.returncode == 0:
-                pdf_path = tex_path.replace('.tex', '.pdf')
-                if os.path.exists(pdf_path):
-                    return pdf_path
-        except Exception as e:
-            print(f"LaTeX compilation failed: {e}")
+        pdf_path = run_pdflatex(tex_path, tex_path.replace('.tex', '.pdf'),
+                                timeout=self.compile_timeout, tmp_root=self.compile_tmp_root)
+        if pdf_path:
+            return pdf_path
         
         # Try HTML to PDF as fallback
         return self._html_to_pdf(tex_path.replace('.tex', '.html'))
@@ -510,20 +554,10 @@ class LaTeXResumeGenerator:
         except Exception as e:
             print(f"WeasyPrint error: {e}")
         
-        # Try playwright
-        try:
-            from playwright.sync_api import sync_playwright
-            with sync_playwright() as p:
-                browser = p.chromium.launch()
-                page = browser.new_page()
-                page.goto(f'file://{os.path.abspath(html_path)}')
-                pdf_path = html_path.replace('.html', '.pdf')
-                page.pdf(path=pdf_path, format='A4', margin={'top': '0.5in', 'bottom': '0.5in', 'left': '0.5in', 'right': '0.5in'})
-                browser.close()
-                if os.path.exists(pdf_path):
-                    return pdf_path
-        except Exception as e:
-            print(f"Playwright error: {e}")
+        # Try playwright (one warm browser for every resume)
+        pdf_path = self.renderer.render(html_path, html_path.replace('.html', '.pdf'))
+        if pdf_path:
+            return pdf_path
         
         # Return HTML path as fallback - user can print to PDF from browser
         return html_path
@@ -553,6 +587,6 @@ class LaTeXResumeGenerator:
             f.write(latex)
         
         # Try to convert to PDF
-        pdf_path = self._html_to_pdf(html_path)
+        pdf_path = self._build_pdf(html, html_path.replace('.html', '.pdf'), lambda: self._html_to_pdf(html_path))
         
         return html_path, ats_score, pdf_path
@@ -0,0 +1,162 @@
+import time
+import queue
+import atexit
+import logging
+import threading
+from typing import Any, Callable, Dict, List, Tuple
+
+logger = logging.getLogger(__name__)
+
+_STOP = object()
+
+# A queued notification: (fn, args, kwargs)
+Item = Tuple[Callable[..., Any], tuple, dict]
+
+
+class _Channel:
+    """One bounded queue drained by one worker thread, so a channel's sends stay in order."""
+
+    def __init__(self, name: str, max_queue: int):
+        self.name = name
+        self.queue: 'queue.Queue' = queue.Queue(maxsize=max_queue)
+        self.stats = {'queued': 0, 'sent': 0, 'failed': 0, 'dropped': 0, 'coalesced': 0,
+                      'max_depth': 0, 'total_latency': 0.0}
+        # Optional hook that merges a backlog of items into fewer sends
+        self.coalescer: Callable[[List[Item]], List[Item]] = None
+        self.coalesce_threshold = 0
+        self.thread = threading.Thread(target=self._run, name=f"notify-{name}", daemon=True)
+        self.thread.start()
+
+    def _take_backlog(self, item) -> List:
+        """The item just taken, plus the whole backlog if it is long enough to coalesce."""
+        items = [item]
+        if self.coalescer and item is not _STOP and self.queue.qsize() + 1 >= self.coalesce_threshold:
+            while True:
+                try:
+                    items.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+        return items
+
+    def _send(self, item: Item):
+        fn, args, kwargs = item
+        start = time.perf_counter()
+        try:
+            ok = fn(*args, **kwargs)
+        except Exception as e:
+            logger.error(f"Notification via {self.name} failed: {e}")
+            ok = False
+        self.stats['total_latency'] += time.perf_counter() - start
+        self.stats['sent' if ok is not False else 'failed'] += 1
+
+    def _run(self):
+        while True:
+            taken = self._take_backlog(self.queue.get())
+            stop = any(item is _STOP for item in taken)
+            items = [item for item in taken if item is not _STOP]
+            try:
+                if len(items) > 1:
+                    try:
+                        merged = self.coalescer(items)
+                        self.stats['coalesced'] += len(items) - len(merged)
+                        items = merged
+                    except Exception as e:
+                        logger.error(f"Coalescing {self.name} notifications failed: {e}")
+                for item in items:
+                    self._send(item)
+            finally:
+                for _ in taken:
+                    self.queue.task_done()
+            if stop:
+                return
+
+
+class NotificationDispatcher:
+    """Sends notifications on background threads so the pipeline never waits on them.
+
+    Each channel (``'telegram'``, ``'popup'``, ...) has its own bounded queue
+    and worker, so a slow Telegram API does not hold up popups and messages
+    on one channel keep their order. A channel can register a coalescer that
+    merges a long backlog into fewer sends. When a queue is full, ``submit`` blocks
+    for up to ``put_timeout`` seconds (backpressure) and then drops the
+    notification, counting it. ``flush`` waits for everything queued so far;
+    ``close`` (also registered with atexit) flushes and stops the workers.
+    """
+
+    def __init__(self, max_queue: int = 100, put_timeout: float = 5, flush_timeout: float = 60):
+        self.max_queue = max_queue
+        self.put_timeout = put_timeout
+        self.flush_timeout = flush_timeout
+        self._channels: Dict[str, _Channel] = {}
+        self._lock = threading.Lock()
+        self._closed = False
+        atexit.register(self.close)
+
+    def _channel(self, name: str) -> _Channel:
+        with self._lock:
+            channel = self._channels.get(name)
+            if channel is None:
+                channel = self._channels[name] = _Channel(name, self.max_queue)
+            return channel
+
+    def set_coalescer(self, channel: str, coalescer: Callable[[List[Item]], List[Item]], threshold: int):
+        """Let ``coalescer`` merge a channel's queued items once ``threshold`` or more are waiting."""
+        ch = self._channel(channel)
+        ch.coalescer = coalescer
+        ch.coalesce_threshold = max(2, threshold)
+
+    def submit(self, channel: str, fn: Callable[..., Any], *args, **kwargs) -> bool:
+        """Queue ``fn(*args, **kwargs)`` on ``channel``; False if it had to be dropped."""
+        if self._closed:
+            # Late notifications after shutdown are still delivered, just synchronously
+            return fn(*args, **kwargs) is not False
+        ch = self._channel(channel)
+        try:
+            ch.queue.put((fn, args, kwargs), timeout=self.put_timeout)
+        except queue.Full:
+            ch.stats['dropped'] += 1
+            logger.warning(f"Notification queue '{channel}' full; dropped one notification")
+            return False
+        ch.stats['queued'] += 1
+        ch.stats['max_depth'] = max(ch.stats['max_depth'], ch.queue.qsize())
+        return True
+
+    def flush(self, timeout: float = None) -> bool:
+        """Wait until every queued notification has been handled; False on timeout."""
+        deadline = time.monotonic() + (self.flush_timeout if timeout is None else timeout)
+        for ch in list(self._channels.values()):
+            with ch.queue.all_tasks_done:
+                while ch.queue.unfinished_tasks:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        logger.warning(f"Timed out flushing notification queue '{ch.name}'")
+                        return False
+                    ch.queue.all_tasks_done.wait(remaining)
+        return True
+
+    def close(self):
+        if self._closed:
+            return
+        self._closed = True
+        self.flush()
+        for ch in self._channels.values():
+            try:
+                # A channel whose flush timed out may still be full; don't let shutdown hang on it
+                ch.queue.put(_STOP, timeout=self.put_timeout)
+            except queue.Full:
+                logger.warning(f"Notification queue '{ch.name}' still busy at shutdown; "
+                               f"abandoning {ch.queue.unfinished_tasks} notifications")
+        for ch in self._channels.values():
+            ch.thread.join(timeout=5)
+        # Closed dispatchers must not pile up in atexit when the scheduler builds one per cycle
+        atexit.unregister(self.close)
+
+    def metrics(self) -> Dict[str, Dict[str, Any]]:
+        result = {}
+        for name, ch in self._channels.items():
+            stats = dict(ch.stats)
+            handled = stats['sent'] + stats['failed']
+            stats['avg_latency'] = stats.pop('total_latency') / handled if handled else 0.0
+            stats['pending'] = ch.queue.unfinished_tasks
+            result[name] = stats
+        return result
@@ -0,0 +1,98 @@
+import os
+import json
+import heapq
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional, Tuple
+
+
+def star_bonus(project: Dict[str, Any]) -> float:
+    stars = project.get('stars', 0) or 0
+    return min(stars / 10, 3) if stars > 0 else 0
+
+
+class ProjectIndex:
+    """Inverted index from match terms to the GitHub projects containing them.
+
+    ``terms_of(project)`` yields a project's terms (keywords, categories, ...)
+    once, at build time. Ranking a job then only walks the posting lists of
+    the terms the job asks for, adds the precomputed star bonuses and keeps
+    the top ``k`` with a heap, instead of rescanning every project per job.
+    """
+
+    def __init__(self, projects: List[Dict[str, Any]], terms_of: Callable[[Dict[str, Any]], Iterable[Hashable]]):
+        self.projects = projects
+        self.postings: Dict[Hashable, List[int]] = {}
+        for i, project in enumerate(projects):
+            for term in set(terms_of(project)):
+                self.postings.setdefault(term, []).append(i)
+        self.bonus = [star_bonus(p) for p in projects]
+        # Starred projects, best bonus first (ties in project order), for jobs that hit few terms
+        self.by_bonus = sorted((i for i, b in enumerate(self.bonus) if b > 0), key=lambda i: (-self.bonus[i], i))
+
+    def rank(self, query: Iterable[Tuple[Hashable, float]], k: int = 5) -> List[Dict[str, Any]]:
+        """Top ``k`` projects for ``(term, weight)`` pairs, as ``{**project, 'match_score': score}``.
+
+        Scores and order match scoring every project and sorting: ties keep
+        the original project order.
+        """
+        term_scores: Dict[int, float] = {}
+        for term, weight in query:
+            for i in self.postings.get(term, ()):
+                term_scores[i] = term_scores.get(i, 0) + weight
+
+        # (score, -index) orders like a stable sort by score over all projects
+        hits = heapq.nlargest(k, ((s + self.bonus[i], -i) for i, s in term_scores.items() if s + self.bonus[i] > 0))
+        # Projects without a hit score only their star bonus: the best k of them head by_bonus
+        fill = []
+        for i in self.by_bonus:
+            if len(fill) == k:
+                break
+            if i not in term_scores:
+                fill.append((self.bonus[i], -i))
+
+        top = heapq.nlargest(k, hits + fill)
+        return [{**self.projects[-neg], 'match_score': score} for score, neg in top]
+
+
+class FileBackedIndex:
+    """Keeps a ProjectIndex in sync with a projects JSON file.
+
+    The index is rebuilt only when the file's modification time or size
+    changes; without the file, the projects given at construction are used.
+    """
+
+    def __init__(self, path: str, projects: Optional[List[Dict[str, Any]]],
+                 build: Callable[[List[Dict[str, Any]]], ProjectIndex]):
+        self.path = path
+        self.build = build
+        self._projects = projects or []
+        self._stamp = None
+        self._index = None
+        self.rebuilds = 0
+
+    def _file_stamp(self) -> Optional[Tuple[float, int]]:
+        try:
+            st = os.stat(self.path)
+        except OSError:
+            return None
+        return st.st_mtime, st.st_size
+
+    def get(self) -> ProjectIndex:
+        stamp = self._file_stamp()
+        if self._index is None or stamp != self._stamp:
+            projects = self._projects
+            if stamp is not None and self._index is not None:
+                # Only reload when the file changed after we were built
+                projects = self._load() or projects
+            self._projects = projects
+            self._index = self.build(projects)
+            self._stamp = stamp
+            self.rebuilds += 1
+        return self._index
+
+    def _load(self) -> List[Dict[str, Any]]:
+        try:
+            with open(self.path, 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"Could not reload {self.path}: {e}")
+            return []
@@ -4,6 +4,20 @@ import re
 import pdfplumber
 from typing import Dict, List, Any
 
+from keyword_matcher import KeywordMatcher
+
+SKILL_KEYWORDS = [
+    'Python', 'Java', 'JavaScript', 'C++', 'C#', 'Ruby', 'Go', 'Rust',
+    'SQL', 'MySQL', 'PostgreSQL', 'MongoDB', 'Redis',
+    'Machine Learning', 'Deep Learning', 'TensorFlow', 'PyTorch', 'Keras',
+    'Data Analysis', 'Data Science', 'Pandas', 'NumPy', 'Scikit-learn',
+    'AWS', 'Azure', 'GCP', 'Docker', 'Kubernetes', 'Git',
+    'React', 'Angular', 'Vue', 'Node.js', 'Django', 'Flask',
+    'NLP', 'Computer Vision', 'Tableau', 'PowerBI', 'Excel',
+    'Statistics', 'Linear Algebra', 'Probability'
+]
+SKILL_MATCHER = KeywordMatcher(SKILL_KEYWORDS, cache_size=4)
+
 class ResumeParser:
     def __init__(self, config):
         self.resume_path = config.get('user', {}).get('resume_path', 'resume.pdf')
@@ -21,25 +35,7 @@ class ResumeParser:
         return text
     
     def extract_skills(self, text: str) -> List[str]:
-        skill_keywords = [
-            'Python', 'Java', 'JavaScript', 'C++', 'C#', 'Ruby', 'Go', 'Rust',
-            'SQL', 'MySQL', 'PostgreSQL', 'MongoDB', 'Redis',
-            'Machine Learning', 'Deep Learning', 'TensorFlow', 'PyTorch', 'Keras',
-            'Data Analysis', 'Data Science', 'Pandas', 'NumPy', 'Scikit-learn',
-            'AWS', 'Azure', 'GCP', 'Docker', 'Kubernetes', 'Git',
-            'React', 'Angular', 'Vue', 'Node.js', 'Django', 'Flask',
-            'NLP', 'Computer Vision', 'Tableau', 'PowerBI', 'Excel',
-            'Statistics', 'Linear Algebra', 'Probability'
-        ]
-        
-        found_skills = []
-        text_lower = text.lower()
-        
-        for skill in skill_keywords:
-            if skill.lower() in text_lower:
-                found_skills.append(skill)
-                
-        return found_skills
+        return SKILL_MATCHER.find(text, SKILL_KEYWORDS)
         
     def extract_experience(self, text: str) -> List[Dict[str, str]]:
         experiences = []
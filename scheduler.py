@@ -1,6 +1,5 @@
 import os
 import sys
-import time
 import yaml
 import logging
 from datetime import datetime, timedelta
@@ -10,12 +9,89 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+class CommandListener:
+    """Background thread that long-polls Telegram for bot commands while the scheduler waits.
+    
+    ``/run`` wakes the scheduler for an immediate run, ``/stats`` replies with
+    the application counters and ``/help`` lists the commands. Only messages
+    from the configured chat are acted on.
+    """
+    
+    HELP = (
+        "<b>Job Agent commands</b>\n"
+        "/run - search and process jobs now\n"
+        "/stats - application counts\n"
+        "/help - this message"
+    )
+    
+    def __init__(self, scheduler, config):
+        from telegram_bot import TelegramNotifier
+        self.scheduler = scheduler
+        self.config = config
+        self.telegram = TelegramNotifier(config)
+        self._stop = threading.Event()
+        self.stats = None
+        self.thread = threading.Thread(target=self._run, name="telegram-commands", daemon=True)
+        
+    def start(self):
+        self.thread.start()
+        
+    def stop(self):
+        self._stop.set()
+        self.telegram.close()
+        
+    def _stats_reader(self):
+        # Created on (and only used from) the listener thread
+        if self.stats is None:
+            from application_manager import ApplicationManager
+            self.stats = ApplicationManager.stats_reader(self.config)
+        return self.stats
+        
+    def _run(self):
+        logger.info("Listening for Telegram commands")
+        while not self._stop.is_set():
+            commands = self.telegram.check_for_commands()
+            if commands is None:
+                # Telegram unreachable or rejecting the poll; back off instead of spinning
+                self._stop.wait(30)
+                continue
+            for command in commands:
+                try:
+                    self.handle(command)
+                except Exception as e:
+                    logger.error(f"Telegram command {command.get('text')!r} failed: {e}")
+            # Only now is the offset moved past these updates
+            self.telegram.ack_commands()
+        if self.stats is not None:
+            self.stats.close()
+                    
+    def handle(self, command: dict):
+        if str(command['chat_id']) != str(self.telegram.chat_id):
+            logger.warning(f"Ignoring Telegram command from chat {command['chat_id']}")
+            return
+        name = command['text'].strip().split(' ')[0].split('@')[0].lower()
+        if name == '/run':
+            self.telegram.send_message("▶️ Starting a job search run...")
+            self.scheduler.request_run()
+        elif name == '/stats':
+            stats = self._stats_reader().read()
+            lines = [f"{status}: {count}" for status, count in stats.items()]
+            self.telegram.send_message("<b>📊 Application stats</b>\n" + "\n".join(lines))
+        elif name in ('/help', '/start'):
+            self.telegram.send_message(self.HELP)
+
+
 class JobAgentScheduler:
-    def __init__(self, run_time="08:00", continuous=False, interval_hours=2):
+    def __init__(self, run_time="08:00", continuous=False, interval_hours=2, config=None):
         self.run_time = run_time
         self.running = True
         self.continuous = continuous
         self.interval_hours = interval_hours
+        self.config = config or {}
+        # Set to cut a wait short: a stop, or a run requested from Telegram
+        self._wake = threading.Event()
+        self._run_requested = False
+        self.listener = None
         
     def get_next_run(self):
         now = datetime.now()
@@ -27,6 +103,17 @@ class JobAgentScheduler:
             
         return next_run
         
+    def request_run(self):
+        self._run_requested = True
+        self._wake.set()
+        
+    def _wait(self, seconds: float) -> bool:
+        """Wait up to ``seconds``; True if a run was requested meanwhile."""
+        self._wake.wait(seconds)
+        self._wake.clear()
+        requested, self._run_requested = self._run_requested, False
+        return requested
+        
     def wait_until_run_time(self):
         while self.running:
             if self.continuous:
@@ -34,7 +121,7 @@ class JobAgentScheduler:
                 logger.info(f"Continuous mode: Running every {self.interval_hours} hours")
                 self.run_agent()
                 logger.info(f"Sleeping for {self.interval_hours} hours...")
-                time.sleep(self.interval_hours * 3600)
+                self._wait(self.interval_hours * 3600)
             else:
                 # Daily mode
                 next_run = self.get_next_run()
@@ -42,9 +129,14 @@ class JobAgentScheduler:
                 
                 if wait_seconds > 0:
                     logger.info(f"Next run at {next_run.strftime('%Y-%m-%d %H:%M:%S')}")
-                    time.sleep(min(wait_seconds, 60))
+                    requested = self._wait(min(wait_seconds, 60))
                 else:
-                    time.sleep(1)
+                    requested = self._wait(1)
+                if not self.running:
+                    break
+                if requested:
+                    self.run_agent()
+                    continue
                     
                 current_time = datetime.now()
                 if current_time.hour == int(self.run_time.split(':')[0]) and current_time.minute < 5:
@@ -52,6 +144,8 @@ class JobAgentScheduler:
                     
     def run_agent(self):
         logger.info("Running job agent...")
+        from browser_pool import shutdown_browser_host
+        agent = None
         try:
             from agent import JobAgent
             agent = JobAgent()
@@ -62,15 +156,34 @@ class JobAgentScheduler:
             logger.error(f"Run failed: {e}")
             import traceback
             traceback.print_exc()
+        finally:
+            # Stop this cycle's notification workers, compile pool and browser, even after a
+            # failed run (the next cycle builds a new agent)
+            if agent is not None:
+                agent.notifier.close()
+                agent.latex_resume.close()
+                agent.telegram.close()
+            shutdown_browser_host()
+            
+    def stop(self):
+        self.running = False
+        self._wake.set()
+        if self.listener:
+            self.listener.stop()
             
     def start(self):
         mode = "Continuous" if self.continuous else "Daily"
         logger.info(f"Scheduler started. {mode} mode.")
+        telegram_config = self.config.get('telegram', {})
+        if telegram_config.get('enabled') and telegram_config.get('listen_commands', True):
+            self.listener = CommandListener(self, self.config)
+            self.listener.start()
         try:
             self.wait_until_run_time()
         except KeyboardInterrupt:
             logger.info("Scheduler stopped")
-            self.running = False
+        finally:
+            self.stop()
             
             
 def main():
@@ -90,19 +203,19 @@ def main():
             agent.initialize()
             agent.run_daily()
         elif sys.argv[1] == '--continuous':
-            scheduler = JobAgentScheduler(continuous=True, interval_hours=interval)
+            scheduler = JobAgentScheduler(continuous=True, interval_hours=interval, config=config)
             scheduler.start()
         elif sys.argv[1] == '--install':
             install_windows_task()
         else:
-            scheduler = JobAgentScheduler(sys.argv[1])
+            scheduler = JobAgentScheduler(sys.argv[1], config=config)
             scheduler.start()
     else:
         if continuous:
-            scheduler = JobAgentScheduler(continuous=True, interval_hours=interval)
+            scheduler = JobAgentScheduler(continuous=True, interval_hours=interval, config=config)
         else:
             run_time = config.get('scheduler', {}).get('run_time', '08:00')
-            scheduler = JobAgentScheduler(run_time)
+            scheduler = JobAgentScheduler(run_time, config=config)
         scheduler.start()
         
         
@@ -1,9 +1,51 @@
 import os
+import json
+import time
+import hashlib
 import logging
+from html import escape
+import threading
 from datetime import datetime
+from typing import Any, Dict, List, Optional
 
 logger = logging.getLogger(__name__)
 
+# Telegram rejects longer message texts
+MAX_MESSAGE_LENGTH = 4096
+# Longer job links are left out of summaries rather than cut (a cut URL or tag breaks the HTML)
+MAX_LINK_LENGTH = 1024
+
+
+class TokenBucket:
+    """Allows ``rate`` sends per second with bursts of up to ``capacity``; ``acquire`` waits for a token.
+
+    A rate of 0 (or less) disables the limit.
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate or 0
+        self.capacity = max(1.0, capacity)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.waited = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        if self.rate <= 0:
+            return
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return
+            wait = (1 - self.tokens) / self.rate
+            self.tokens = 0
+            self.updated = now + wait
+            self.waited += wait
+        time.sleep(wait)
+
 
 class TelegramNotifier:
     def __init__(self, config):
@@ -13,6 +55,186 @@ class TelegramNotifier:
         # Priority: Environment Variable > Config File
         self.bot_token = os.getenv('TELEGRAM_BOT_TOKEN', self.telegram_config.get('bot_token', ''))
         self.chat_id = os.getenv('TELEGRAM_CHAT_ID', self.telegram_config.get('chat_id', ''))
+        # Retries for 429s (honoring retry_after), 5xx and network errors
+        self.max_retries = self.telegram_config.get('max_retries', 3)
+        self.backoff = self.telegram_config.get('backoff', 1.0)
+        self.max_retry_after = self.telegram_config.get('max_retry_after', 60)
+        self._client = None
+        self._client_lock = threading.Lock()
+        self._closed = False
+        # Token buckets keep sends under Telegram's per-chat and global rate limits
+        self.per_chat_rate = self.telegram_config.get('per_chat_rate', 1.0)
+        self.per_chat_burst = self.telegram_config.get('per_chat_burst', 3)
+        self.global_bucket = TokenBucket(self.telegram_config.get('global_rate', 30),
+                                         self.telegram_config.get('global_burst', 30))
+        self.chat_buckets: Dict[str, TokenBucket] = {}
+        # Queued job alerts are merged into digests once this many notifications are waiting
+        self.digest_threshold = self.telegram_config.get('digest_threshold', 5)
+        # Per API method: calls, failures, retries and total latency (seconds)
+        self.metrics: Dict[str, Dict[str, float]] = {}
+        # Content hash -> Telegram file_id of documents already uploaded by this bot
+        self.file_id_cache_path = self.telegram_config.get('file_id_cache', 'data/telegram_file_ids.json')
+        self._file_ids: Optional[Dict[str, str]] = None
+        self._file_ids_lock = threading.Lock()
+        self.upload_stats = {'uploads': 0, 'reused': 0, 'bytes': 0, 'bytes_saved': 0, 'latency': 0.0}
+        # (status code, description) of this thread's last rejected API call
+        self._last_error = threading.local()
+        # Long polling for bot commands: seconds Telegram holds getUpdates open, and where the next offset is kept
+        self.poll_timeout = self.telegram_config.get('poll_timeout', 30)
+        self.offset_path = self.telegram_config.get('offset_path', 'data/telegram_offset.json')
+        self._offset: Optional[int] = None
+        self._unacked_offset: Optional[int] = None
+        
+    def _get_client(self):
+        """One pooled keep-alive client for every API call (HTTP/2 when the h2 package is installed).
+        
+        None once close() has been called, so a retry still in flight cannot build a new one.
+        """
+        with self._client_lock:
+            if self._closed:
+                return None
+            if self._client is None:
+                self._client = self._new_client()
+            return self._client
+            
+    def _new_client(self):
+        import httpx
+        try:
+            import h2  # noqa: F401
+            http2 = True
+        except ImportError:
+            http2 = False
+        return httpx.Client(
+            http2=http2,
+            timeout=self.telegram_config.get('timeout', 10),
+            limits=httpx.Limits(max_connections=10, max_keepalive_connections=5)
+        )
+        
+    def close(self):
+        with self._client_lock:
+            self._closed = True
+            client, self._client = self._client, None
+        if client is not None:
+            client.close()
+            
+    def _api(self, method: str, timeout: float = None, **kwargs) -> Optional[Dict[str, Any]]:
+        """Call a Bot API method, retrying with backoff; returns the decoded reply or None."""
+        import httpx
+        url = f"https://api.telegram.org/bot{self.bot_token}/{method}"
+        chat_id = (kwargs.get('json') or kwargs.get('data') or {}).get('chat_id')
+        stats = self.metrics.setdefault(method, {'calls': 0, 'failures': 0, 'retries': 0, 'latency': 0.0})
+        stats['calls'] += 1
+        start = time.perf_counter()
+        self._last_error.value = None
+        
+        try:
+            for attempt in range(self.max_retries + 1):
+                delay = self.backoff * (2 ** attempt)
+                for upload in (kwargs.get('files') or {}).values():
+                    # Uploads are re-read from the start on each attempt
+                    handle = upload[1] if isinstance(upload, tuple) else upload
+                    if hasattr(handle, 'seek'):
+                        handle.seek(0)
+                if chat_id is not None:
+                    self._throttle(str(chat_id))
+                client = self._get_client()
+                if client is None:
+                    logger.info(f"Telegram {method} skipped: notifier closed")
+                    break
+                try:
+                    response = client.post(url, timeout=timeout or httpx.USE_CLIENT_DEFAULT, **kwargs)
+                except httpx.TransportError as e:
+                    logger.warning(f"Telegram {method} network error: {e}")
+                else:
+                    try:
+                        payload = response.json()
+                    except ValueError:
+                        payload = {}
+                    if response.status_code == 200 and payload.get('ok'):
+                        return payload
+                    if response.status_code == 429:
+                        retry_after = payload.get('parameters', {}).get('retry_after') \
+                            or response.headers.get('retry-after')
+                        if retry_after:
+                            delay = float(retry_after)
+                        if delay > self.max_retry_after:
+                            logger.error(f"Telegram {method} rate limited for {delay:.0f}s; giving up")
+                            break
+                    elif response.status_code < 500:
+                        description = payload.get('description', response.text[:200])
+                        self._last_error.value = (response.status_code, description)
+                        logger.error(f"Telegram {method} failed ({response.status_code}): {description}")
+                        break
+                    else:
+                        logger.warning(f"Telegram {method} server error {response.status_code}")
+                if attempt < self.max_retries:
+                    stats['retries'] += 1
+                    time.sleep(delay)
+            stats['failures'] += 1
+            return None
+        finally:
+            stats['latency'] += time.perf_counter() - start
+            
+    def _throttle(self, chat_id: str):
+        bucket = self.chat_buckets.get(chat_id)
+        if bucket is None:
+            bucket = self.chat_buckets[chat_id] = TokenBucket(self.per_chat_rate, self.per_chat_burst)
+        bucket.acquire()
+        self.global_bucket.acquire()
+        
+    def latency_report(self) -> Dict[str, Dict[str, float]]:
+        """Per-method call counts, failures, retries and average latency."""
+        return {
+            method: {**stats, 'avg_latency': stats['latency'] / stats['calls'] if stats['calls'] else 0.0}
+            for method, stats in self.metrics.items()
+        }
+        
+    def upload_report(self) -> Dict[str, float]:
+        """Documents uploaded vs. sent by cached file_id, bytes sent/saved and average upload time."""
+        stats = dict(self.upload_stats)
+        stats['avg_latency'] = stats.pop('latency') / stats['uploads'] if stats['uploads'] else 0.0
+        return stats
+        
+    @staticmethod
+    def _file_digest(file_path: str) -> str:
+        digest = hashlib.sha256()
+        with open(file_path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1 << 20), b''):
+                digest.update(chunk)
+        return digest.hexdigest()
+        
+    def _cached_file_id(self, digest: str) -> Optional[str]:
+        with self._file_ids_lock:
+            if self._file_ids is None:
+                try:
+                    with open(self.file_id_cache_path, 'r') as f:
+                        self._file_ids = json.load(f)
+                except (OSError, ValueError):
+                    self._file_ids = {}
+            return self._file_ids.get(digest)
+        
+    def _file_id_rejected(self) -> bool:
+        """Whether the last call failed because Telegram refused the file identifier itself."""
+        error = self._last_error.value
+        if not error or error[0] != 400:
+            return False
+        description = str(error[1]).lower()
+        return 'file identifier' in description or 'file_id' in description
+        
+    def _remember_file_id(self, digest: str, file_id: Optional[str]):
+        with self._file_ids_lock:
+            if file_id:
+                self._file_ids[digest] = file_id
+            else:
+                self._file_ids.pop(digest, None)
+            try:
+                os.makedirs(os.path.dirname(self.file_id_cache_path) or '.', exist_ok=True)
+                tmp = self.file_id_cache_path + '.tmp'
+                with open(tmp, 'w') as f:
+                    json.dump(self._file_ids, f, indent=2)
+                os.replace(tmp, self.file_id_cache_path)
+            except OSError as e:
+                logger.warning(f"Could not save Telegram file_id cache: {e}")
         
     def send_message(self, message: str) -> bool:
         if not self.enabled or not self.bot_token or not self.chat_id:
@@ -20,16 +242,13 @@ class TelegramNotifier:
             return False
             
         try:
-            import requests
-            url = f"https://api.telegram.org/bot{self.bot_token}/sendMessage"
             data = {
                 'chat_id': self.chat_id,
                 'text': message,
                 'parse_mode': 'HTML',
                 'disable_web_page_preview': False
             }
-            response = requests.post(url, json=data, timeout=10)
-            return response.status_code == 200
+            return self._api('sendMessage', json=data) is not None
         except Exception as e:
             logger.error(f"Telegram error: {e}")
             return False
@@ -43,12 +262,34 @@ class TelegramNotifier:
             return False
             
         try:
-            import requests
-            url = f"https://api.telegram.org/bot{self.bot_token}/sendDocument"
-            files = {'document': open(file_path, 'rb')}
             data = {'chat_id': self.chat_id, 'caption': caption, 'parse_mode': 'HTML'}
-            response = requests.post(url, data=data, files=files, timeout=20)
-            return response.status_code == 200
+            size = os.path.getsize(file_path)
+            digest = self._file_digest(file_path)
+            
+            # Identical files were uploaded before: send them by file_id instead of re-uploading
+            file_id = self._cached_file_id(digest)
+            if file_id:
+                if self._api('sendDocument', json={**data, 'document': file_id}) is not None:
+                    self.upload_stats['reused'] += 1
+                    self.upload_stats['bytes_saved'] += size
+                    return True
+                if not self._file_id_rejected():
+                    # Network errors, rate limits, 5xx: keep the file_id and let the caller retry later
+                    return False
+                # The file_id is no longer accepted (e.g. a different bot); upload again
+                self._remember_file_id(digest, None)
+            
+            start = time.perf_counter()
+            with open(file_path, 'rb') as f:
+                files = {'document': (os.path.basename(file_path), f)}
+                result = self._api('sendDocument', timeout=20, data=data, files=files)
+            self.upload_stats['latency'] += time.perf_counter() - start
+            self.upload_stats['uploads'] += 1
+            if result is None:
+                return False
+            self.upload_stats['bytes'] += size
+            self._remember_file_id(digest, result.get('result', {}).get('document', {}).get('file_id'))
+            return True
         except Exception as e:
             logger.error(f"Telegram document error: {e}")
             return False
@@ -91,28 +332,82 @@ class TelegramNotifier:
         if not jobs:
             return False
             
-        message = f"""
-<b>📋 JOBS FOUND - {datetime.now().strftime('%Y-%m-%d')}</b>
-
-<b>Found {len(jobs)} new jobs!</b>
-
-"""
-        
+        message = self._summary_header(len(jobs))
         for i, job in enumerate(jobs[:10], 1):
-            title = job.get('title', 'Position')[:40]
-            company = job.get('company', 'Company')[:25]
-            url = job.get('url', '')
-            match = job.get('match_score', 0)
-            
-            message += f"{i}. <b>{title}</b>\n"
-            message += f"   🏢 {company} | ⭐ {match:.0%}\n"
-            message += f"   🔗 <a href=\"{url}\">Apply</a>\n\n"
+            message += self._summary_entry(i, job)
         
         if len(jobs) > 10:
             message += f"\n...and {len(jobs) - 10} more jobs"
             
         return self.send_message(message)
         
+    def _summary_header(self, count: int, part: str = "") -> str:
+        return f"""
+<b>📋 JOBS FOUND - {datetime.now().strftime('%Y-%m-%d')}{part}</b>
+
+<b>Found {count} new jobs!</b>
+
+"""
+        
+    def _summary_entry(self, i: int, job: dict) -> str:
+        # Truncate before escaping so an entity is never cut in half
+        title = escape(str(job.get('title', 'Position'))[:40])
+        company = escape(str(job.get('company', 'Company'))[:25])
+        url = str(job.get('url', ''))
+        match = job.get('match_score', 0)
+        
+        entry = f"{i}. <b>{title}</b>\n"
+        entry += f"   🏢 {company} | ⭐ {match:.0%}\n"
+        if url and len(url) <= MAX_LINK_LENGTH:
+            entry += f"   🔗 <a href=\"{escape(url)}\">Apply</a>\n"
+        return entry + "\n"
+        
+    def send_jobs_digest(self, jobs: list) -> bool:
+        """Every job in the send_jobs_summary format, split into as few messages as fit 4096 chars."""
+        if not jobs:
+            return False
+        
+        entries = [self._summary_entry(i, job) for i, job in enumerate(jobs, 1)]
+        messages: List[List[str]] = [[]]
+        # Leave room for the longest possible header: never more parts than jobs
+        budget = MAX_MESSAGE_LENGTH - len(self._summary_header(len(jobs), f" (part {len(jobs)}/{len(jobs)})"))
+        size = 0
+        for entry in entries:
+            if messages[-1] and size + len(entry) > budget:
+                messages.append([])
+                size = 0
+            messages[-1].append(entry)
+            size += len(entry)
+        
+        ok = True
+        for n, chunk in enumerate(messages, 1):
+            part = f" (part {n}/{len(messages)})" if len(messages) > 1 else ""
+            # Entries are whole and bounded, so the message is never cut mid-tag
+            ok = self.send_message(self._summary_header(len(jobs), part) + ''.join(chunk)) and ok
+        return ok
+        
+    def coalesce_alerts(self, items: list) -> list:
+        """Dispatcher coalescer: merge queued send_job_alert calls into one digest.
+        
+        The digest takes the place of the first alert; everything else (resume
+        documents, other messages) keeps its order. Networking hooks are left
+        out of digests.
+        """
+        jobs = []
+        merged = []
+        for fn, args, kwargs in items:
+            if getattr(fn, '__func__', None) is TelegramNotifier.send_job_alert and getattr(fn, '__self__', None) is self:
+                job, match_score = args[0], args[1] if len(args) > 1 else kwargs.get('match_score', 0)
+                if not jobs:
+                    merged.append((self.send_jobs_digest, (jobs,), {}))
+                jobs.append({**job, 'match_score': match_score})
+            else:
+                merged.append((fn, args, kwargs))
+        if len(jobs) == 1:
+            # Nothing to merge; send the original alert
+            merged = items
+        return merged
+        
     def send_application_success(self, job: dict) -> bool:
         message = f"""
 <b>✅ APPLICATION SENT!</b>
@@ -152,25 +447,64 @@ Keep applying! 💪
         self.send_message(message)
         return None
         
-    def check_for_commands(self) -> dict:
+    def _load_offset(self) -> int:
+        if self._offset is None:
+            try:
+                with open(self.offset_path, 'r') as f:
+                    self._offset = int(json.load(f).get('offset', 0))
+            except (OSError, ValueError, AttributeError):
+                self._offset = 0
+        return self._offset
+        
+    def _save_offset(self, offset: int):
+        self._offset = offset
+        try:
+            os.makedirs(os.path.dirname(self.offset_path) or '.', exist_ok=True)
+            tmp = self.offset_path + '.tmp'
+            with open(tmp, 'w') as f:
+                json.dump({'offset': offset}, f)
+            os.replace(tmp, self.offset_path)
+        except OSError as e:
+            logger.warning(f"Could not save Telegram update offset: {e}")
+            
+    def check_for_commands(self, poll_timeout: int = None) -> Optional[List[dict]]:
+        """Long-poll getUpdates and return every new message once, oldest first.
+        
+        Telegram holds the request open for up to ``poll_timeout`` seconds until
+        an update arrives. Call ``ack_commands`` once they have been handled:
+        only then is the offset past them stored in telegram.offset_path, so
+        a crash while handling redelivers them after a restart. Until then the
+        next poll returns them again. Returns None if the call failed.
+        """
         if not self.enabled or not self.bot_token:
             return None
             
+        poll_timeout = self.poll_timeout if poll_timeout is None else poll_timeout
         try:
-            import requests
-            url = f"https://api.telegram.org/bot{self.bot_token}/getUpdates"
-            response = requests.get(url, timeout=10)
-            if response.status_code == 200:
-                data = response.json()
-                if data.get('ok') and data.get('result'):
-                    updates = data['result']
-                    if updates:
-                        last_update = updates[-1]
-                        if 'message' in last_update:
-                            return {
-                                'chat_id': last_update['message']['chat']['id'],
-                                'text': last_update['message'].get('text', ''),
-                            }
+            data = self._api('getUpdates', timeout=poll_timeout + 10, json={
+                'offset': self._load_offset(),
+                'timeout': poll_timeout,
+                'allowed_updates': ['message'],
+            })
+            if data is None:
+                return None
+            updates = data.get('result') or []
+            if updates:
+                self._unacked_offset = max(u['update_id'] for u in updates) + 1
+            return [
+                {
+                    'update_id': u['update_id'],
+                    'chat_id': u['message']['chat']['id'],
+                    'text': u['message'].get('text', ''),
+                }
+                for u in updates if 'message' in u
+            ]
         except Exception as e:
             logger.error(f"Telegram check error: {e}")
         return None
+        
+    def ack_commands(self):
+        """Mark everything returned by the last check_for_commands as handled."""
+        if self._unacked_offset is not None:
+            self._save_offset(self._unacked_offset)
+            self._unacked_offset = None
@@ -0,0 +1,62 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import job_analyzer
+from job_analyzer import DESCRIPTION_MATCHER, JobAnalyzer
+from project_index import ProjectIndex
+
+PROJECTS = [
+    {'name': 'rag-chatbot', 'description': 'RAG chatbot with LangChain and LLM', 'language': 'Python', 'stars': 12},
+    {'name': 'sales-dashboard', 'description': 'Data analysis dashboard with Pandas and SQL', 'language': 'Python', 'stars': 3},
+    {'name': 'todo-api', 'description': 'REST API with Django and Docker', 'language': 'Python', 'stars': 0},
+]
+
+RESUME = {'skills': ['Python', 'Machine Learning', 'SQL', 'Docker'], 'experience': []}
+
+
+@pytest.fixture
+def analyzer(tmp_path, monkeypatch):
+    # The project index and analysis cache keep files under data/
+    monkeypatch.chdir(tmp_path)
+    return JobAnalyzer({'analysis_cache': {'enabled': False}}, PROJECTS, RESUME)
+
+
+@pytest.fixture
+def rank_calls(monkeypatch):
+    calls = []
+    rank = ProjectIndex.rank
+
+    def counting_rank(self, *args, **kwargs):
+        calls.append(args)
+        return rank(self, *args, **kwargs)
+
+    monkeypatch.setattr(ProjectIndex, 'rank', counting_rank)
+    return calls
+
+
+@pytest.mark.parametrize('job_type', job_analyzer.JOB_TYPES)
+def test_ats_score_scans_description_once(analyzer, rank_calls, job_type):
+    # A description no earlier test used, so the matcher's memo cannot hide a scan
+    description = (f"{job_type} role {id(analyzer)}: Python, machine learning, PyTorch, SQL, "
+                   "Docker and AWS. 2+ years of experience, bachelor's degree in computer science.")
+    before = DESCRIPTION_MATCHER.scans
+
+    result = analyzer.calculate_ats_score(description, job_type)
+
+    assert DESCRIPTION_MATCHER.scans - before <= 1
+    assert len(rank_calls) == 1
+    assert 0 <= result['total'] <= 100
+
+
+def test_repeated_description_is_not_rescanned(analyzer):
+    description = "ML Engineer: Python, TensorFlow and NLP in production."
+    analyzer.calculate_ats_score(description, 'ML Engineer')
+    before = DESCRIPTION_MATCHER.scans
+
+    analyzer.calculate_ats_score(description, 'ML Engineer')
+
+    assert DESCRIPTION_MATCHER.scans == before